@@ -53,6 +53,25 @@ except Exception as e:
     print(f"📝 콘솔 전용 모드로 실행됩니다.")
 
 
+# 신호 파싱 정규식 (메시지마다 다시 컴파일하지 않도록 모듈 로드 시 1회 컴파일)
+_STOCK_CODE_RE = re.compile(r'\((\d{6})\)')
+_NAME_PREFIX_COLON_RE = re.compile(r'.*[:：]\s*')
+_NAME_PREFIX_POINTER_RE = re.compile(r'.*👉\s*')
+
+# 적정 매수가, 매도가, 목표가 → target_price (앞에 있을수록 우선)
+_TARGET_PRICE_RES = tuple(re.compile(p) for p in (
+    r'적정\s*매수가?\s*[:：]\s*([\d,]+)원?',
+    r'매도가\s*[:：👉]\s*([\d,]+)원?',
+    r'목표가\s*[:：👉]\s*([\d,]+)원?',
+))
+
+# 현재가, 매수가, 포착 현재가 → current_price (앞에 있을수록 우선)
+_CURRENT_PRICE_RES = tuple(re.compile(p) for p in (
+    r'(?:포착\s*)?현재가\s*[:：]\s*([\d,]+)원?',
+    r'매수가\s*[:：👉]\s*([\d,]+)원?',
+))
+
+
 class TelegramTradingSystem(TradingSystemBase):
     """텔레그램 채널 기반 자동매매 시스템"""
 
@@ -124,8 +143,8 @@ class TelegramTradingSystem(TradingSystemBase):
         """
         try:
             # 1. 괄호 안의 6자리 숫자 추출 (종목코드)
-            stock_code_pattern = r'\((\d{6})\)'
-            match = re.search(stock_code_pattern, message_text)
+            # 괄호가 없는 일반 메시지는 정규식 검색 없이 바로 제외
+            match = "(" in message_text and _STOCK_CODE_RE.search(message_text)
 
             if not match:
                 logger.debug("ℹ️ 괄호 안의 6자리 숫자를 찾을 수 없습니다")
@@ -196,8 +215,8 @@ class TelegramTradingSystem(TradingSystemBase):
         # 불필요한 접두사 제거
         # "포착 종목명 : 벨로크" → "벨로크"
         # "종목명 👉 유일에너테크" → "유일에너테크"
-        stock_name = re.sub(r'.*[:：]\s*', '', stock_name).strip()
-        stock_name = re.sub(r'.*👉\s*', '', stock_name).strip()
+        stock_name = _NAME_PREFIX_COLON_RE.sub('', stock_name).strip()
+        stock_name = _NAME_PREFIX_POINTER_RE.sub('', stock_name).strip()
 
         return stock_name
 
@@ -211,14 +230,8 @@ class TelegramTradingSystem(TradingSystemBase):
         prices = {"target": None, "current": None}
 
         # 1. 적정 매수가, 매도가, 목표가 → target_price
-        target_patterns = [
-            r'적정\s*매수가?\s*[:：]\s*([\d,]+)원?',
-            r'매도가\s*[:：👉]\s*([\d,]+)원?',
-            r'목표가\s*[:：👉]\s*([\d,]+)원?'
-        ]
-
-        for pattern in target_patterns:
-            match = re.search(pattern, message_text)
+        for pattern in _TARGET_PRICE_RES:
+            match = pattern.search(message_text)
             if match:
                 try:
                     prices["target"] = int(match.group(1).replace(',', ''))
@@ -227,13 +240,8 @@ class TelegramTradingSystem(TradingSystemBase):
                     continue
 
         # 2. 현재가, 매수가, 포착 현재가 → current_price
-        current_patterns = [
-            r'(?:포착\s*)?현재가\s*[:：]\s*([\d,]+)원?',
-            r'매수가\s*[:：👉]\s*([\d,]+)원?'
-        ]
-
-        for pattern in current_patterns:
-            match = re.search(pattern, message_text)
+        for pattern in _CURRENT_PRICE_RES:
+            match = pattern.search(message_text)
             if match:
                 try:
                     prices["current"] = int(match.group(1).replace(',', ''))
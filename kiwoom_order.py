@@ -4,10 +4,14 @@
 실시간 종목 포착 시 자동으로 매수 주문을 실행합니다.
 """
 
+import json
 import os
 import re
 import requests
+from bisect import bisect_right
+from functools import lru_cache
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, Optional
 from dotenv import load_dotenv
 import logging
@@ -17,6 +21,11 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# 종목코드 검증 캐시 파일 (실행 간 유지, 서버 도메인별 구역으로 저장) 및 보관 정책
+STOCK_CODE_CACHE_FILE = Path("./stock_code_cache.json")
+_STOCK_CODE_CACHE_TTL = {True: timedelta(hours=24), False: timedelta(hours=1)}  # 유효 24시간 / 무효 1시간
+_STOCK_CODE_CACHE_MAX = 10000  # 초과 시 가장 오래된 항목부터 제거
+
 
 class KiwoomOrderAPI:
     """키움증권 주식 주문 API 클래스"""
@@ -41,9 +50,10 @@ class KiwoomOrderAPI:
         self.access_token: Optional[str] = None
         self._token_expiry: Optional[datetime] = None  # 토큰 만료 시간
 
-        # 종목코드 검증 캐시 (메모리 캐싱)
-        self._stock_code_cache: Dict[str, Dict] = {}
-        # {종목코드: {"valid": bool, "cached_at": datetime, "stock_name": str}}
+        # 종목코드 검증 캐시 (메모리, 시작 시 파일에서 현재 서버 도메인의 만료되지 않은 항목만 불러옴)
+        self._stock_code_cache: Dict[str, Dict] = self._load_stock_code_cache()
+        # {종목코드: {"valid": bool, "cached_at": datetime, "stock_name": str, "reason": str}}
+        self._stock_code_cache_dirty = False  # 파일에 저장되지 않은 변경 여부 (save_stock_code_cache에서 저장)
 
         if not self.app_key or not self.secret_key:
             raise ValueError(f"환경변수에 API KEY가 설정되어 있지 않습니다. (모의투자: {use_mock})")
@@ -558,6 +568,8 @@ class KiwoomOrderAPI:
         캐싱 정책:
         - 유효한 종목: 24시간 캐싱
         - 무효한 종목: 1시간 캐싱 (나중에 상장될 수 있음)
+        - API 조회 실패(토큰/네트워크 오류)는 일시적이므로 캐싱하지 않음
+        - save_stock_code_cache() 호출 시 stock_code_cache.json에 저장되어 다시 실행해도 유지
 
         Args:
             stock_code: 검증할 종목코드 (6자리)
@@ -579,8 +591,7 @@ class KiwoomOrderAPI:
             is_valid = cache_entry["valid"]
 
             # 캐시 만료 시간 계산
-            cache_duration = timedelta(hours=24) if is_valid else timedelta(hours=1)
-            cache_expiry = cached_at + cache_duration
+            cache_expiry = cached_at + _STOCK_CODE_CACHE_TTL[is_valid]
 
             # 캐시가 유효한 경우
             if datetime.now() < cache_expiry:
@@ -610,7 +621,8 @@ class KiwoomOrderAPI:
                 "cached": False
             }
 
-        if not stock_code.isdigit():
+        # isdigit()은 '²' 같은 유니코드 숫자도 허용하므로 ASCII 여부를 함께 확인
+        if not (stock_code.isascii() and stock_code.isdigit()):
             reason = f"종목코드는 6자리 숫자여야 합니다 (입력값: {stock_code})"
             logger.warning(f"⚠️ 종목코드 형식 오류: {stock_code} - {reason}")
             self._cache_validation_result(stock_code, False, "", reason)
@@ -635,8 +647,8 @@ class KiwoomOrderAPI:
             }
 
         # 3. 범위 검증: 000001 ~ 999999
-        stock_code_int = int(stock_code)
-        if stock_code_int < 1 or stock_code_int > 999999:
+        # 6자리 숫자는 항상 999999 이하이므로 000000만 걸러내면 됨 (정수 변환 불필요)
+        if stock_code == "000000":
             reason = f"유효하지 않은 종목코드 범위 (000001 ~ 999999)"
             logger.warning(f"⚠️ 종목코드 범위 오류: {stock_code} - {reason}")
             self._cache_validation_result(stock_code, False, "", reason)
@@ -655,7 +667,7 @@ class KiwoomOrderAPI:
         if not price_result.get("success"):
             reason = f"키움 API 조회 실패: {price_result.get('message', '알 수 없는 오류')}"
             logger.warning(f"⚠️ 종목코드 API 검증 실패: {stock_code} - {reason}")
-            self._cache_validation_result(stock_code, False, "", reason)
+            # 일시적인 조회 실패일 수 있으므로 캐싱하지 않음 (다음 신호에서 다시 조회)
             return {
                 "valid": False,
                 "stock_code": stock_code,
@@ -693,6 +705,25 @@ class KiwoomOrderAPI:
             "cached": False
         }
 
+    def validate_stock_codes(self, stock_codes: list, use_cache: bool = True) -> Dict[str, Dict]:
+        """
+        여러 종목코드 일괄 검증
+
+        키움 API에는 다건 종목 조회가 없어 종목별로 validate_stock_code()를 호출하되,
+        중복 코드는 한 번만 검증하고 형식/범위 오류와 캐시된 코드는 API를 호출하지 않습니다.
+
+        Args:
+            stock_codes: 검증할 종목코드 목록
+            use_cache: 캐시 사용 여부 (기본: True)
+
+        Returns:
+            {종목코드: validate_stock_code() 결과} 딕셔너리
+        """
+        return {
+            stock_code: self.validate_stock_code(stock_code, use_cache=use_cache)
+            for stock_code in dict.fromkeys(stock_codes)
+        }
+
     def _cache_validation_result(self, stock_code: str, valid: bool, stock_name: str, reason: str) -> None:
         """
         종목코드 검증 결과를 캐시에 저장
@@ -703,14 +734,80 @@ class KiwoomOrderAPI:
             stock_name: 종목명
             reason: 무효 사유
         """
-        self._stock_code_cache[stock_code] = {
+        cache = self._stock_code_cache
+
+        # 다시 넣은 항목이 가장 최근 순서가 되도록 기존 항목 제거 후 추가
+        cache.pop(stock_code, None)
+        cache[stock_code] = {
             "valid": valid,
             "stock_name": stock_name,
             "reason": reason,
             "cached_at": datetime.now()
         }
+        while len(cache) > _STOCK_CODE_CACHE_MAX:
+            del cache[next(iter(cache))]
+
+        self._stock_code_cache_dirty = True
         logger.debug(f"💾 종목코드 검증 결과 캐싱: {stock_code} (유효: {valid})")
 
+    def _load_stock_code_cache(self) -> Dict[str, Dict]:
+        """
+        파일에 저장된 종목코드 검증 캐시 로드 (현재 서버 도메인 구역만, 만료된 항목은 제외)
+
+        Returns:
+            {종목코드: 캐시 항목} 딕셔너리 (파일이 없거나 읽기 실패 시 빈 딕셔너리)
+        """
+        if not STOCK_CODE_CACHE_FILE.exists():
+            return {}
+
+        try:
+            with open(STOCK_CODE_CACHE_FILE, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+
+            now = datetime.now()
+            cache = {}
+            for stock_code, entry in saved.get(self.base_url, {}).items():
+                cached_at = datetime.fromisoformat(entry["cached_at"])
+                if now < cached_at + _STOCK_CODE_CACHE_TTL[entry["valid"]]:
+                    cache[stock_code] = {**entry, "cached_at": cached_at}
+
+            logger.debug(f"📂 종목코드 검증 캐시 로드: {len(cache)}개")
+            return cache
+
+        except Exception as e:
+            logger.warning(f"⚠️ 종목코드 검증 캐시 로드 실패 (빈 캐시로 시작): {e}")
+            return {}
+
+    def save_stock_code_cache(self) -> None:
+        """
+        종목코드 검증 캐시를 파일에 저장 (다음 실행에서 재사용)
+
+        검증할 때마다 쓰지 않고 종료 시 한 번 호출합니다 (변경이 없으면 아무것도 하지 않음).
+        파일 I/O가 있으므로 이벤트 루프에서는 asyncio.to_thread()로 호출하세요.
+        다른 서버 도메인(모의/실전) 구역은 그대로 유지합니다.
+        """
+        if not self._stock_code_cache_dirty:
+            return
+
+        try:
+            saved = {}
+            if STOCK_CODE_CACHE_FILE.exists():
+                with open(STOCK_CODE_CACHE_FILE, 'r', encoding='utf-8') as f:
+                    saved = json.load(f)
+
+            saved[self.base_url] = {
+                stock_code: {**entry, "cached_at": entry["cached_at"].isoformat()}
+                for stock_code, entry in self._stock_code_cache.items()
+            }
+            with open(STOCK_CODE_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(saved, f, ensure_ascii=False, indent=2)
+
+            self._stock_code_cache_dirty = False
+            logger.debug(f"💾 종목코드 검증 캐시 저장: {len(self._stock_code_cache)}개")
+
+        except Exception as e:
+            logger.warning(f"⚠️ 종목코드 검증 캐시 저장 실패: {e}")
+
     def get_account_balance(self, query_date: str = None) -> Dict:
         """
         계좌 잔고 및 보유종목 조회 (ka01690)
@@ -1242,43 +1339,59 @@ def parse_price_string(price_str: str) -> int:
     """
     가격 문자열을 정수로 변환
     예: "75,000원" -> 75000
+
+    숫자가 아니거나 음수인 경우 0을 반환합니다.
+    부호가 붙은 가격(예: "+75,000")은 '+'를 제거하고, "-75,000"은 음수로 보아 0을 반환합니다.
     """
     if not price_str or price_str == '-':
         return 0
 
-    # 쉼표, 원 제거 후 정수 변환
+    # 쉼표, 원 제거 (짧은 문자열에서는 replace가 translate보다 빠름)
     clean_str = price_str.replace(',', '').replace('원', '').strip()
+    if clean_str[:1] == '+':
+        clean_str = clean_str[1:]
 
-    try:
+    # 숫자로만 이루어진 경우에만 변환 (예외 처리 없이 판별)
+    if clean_str.isdecimal():
         return int(clean_str)
-    except ValueError:
-        return 0
+    return 0
+
+
+# 호가 단위 테이블: 가격이 _TICK_BREAKS[i] 이상이면 _TICK_SIZES[i + 1]
+_TICK_BREAKS = (1000, 5000, 10000, 50000, 100000, 500000)
+_TICK_SIZES = (1, 5, 10, 50, 100, 500, 1000)
 
 
+@lru_cache(maxsize=4096)
 def get_tick_size(price: int) -> int:
     """
     주가에 따른 호가 단위(틱) 계산
 
+    같은 가격이 반복 조회되는 실시간 시세 처리를 위해 결과를 캐싱합니다.
+
     Args:
         price: 현재 주가
 
     Returns:
         호가 단위 (1틱)
     """
-    if price < 1000:
-        return 1
-    elif price < 5000:
-        return 5
-    elif price < 10000:
-        return 10
-    elif price < 50000:
-        return 50
-    elif price < 100000:
-        return 100
-    elif price < 500000:
-        return 500
-    else:
-        return 1000
+    # 구간 경계가 정수이므로 소수점 이하 버림은 결과에 영향 없음
+    return _TICK_SIZES[bisect_right(_TICK_BREAKS, int(price))]
+
+
+def get_tick_sizes(prices) -> list:
+    """
+    여러 주가의 호가 단위(틱)를 한 번에 계산
+
+    Args:
+        prices: 주가 목록
+
+    Returns:
+        각 주가에 대한 호가 단위 리스트
+    """
+    breaks = _TICK_BREAKS
+    sizes = _TICK_SIZES
+    return [sizes[bisect_right(breaks, price)] for price in prices]
 
 
 def calculate_sell_price(current_price: int, buy_price: int = None, profit_rate: float = None) -> int:
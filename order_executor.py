@@ -13,7 +13,7 @@ import logging
 from typing import Optional
 from datetime import datetime
 
-from kiwoom_order import KiwoomOrderAPI
+from kiwoom_order import KiwoomOrderAPI, calculate_sell_price as calculate_tick_sell_price
 
 logger = logging.getLogger(__name__)
 
@@ -707,13 +707,11 @@ class OrderExecutor:
         Returns:
             int: 매도가 (한 틱 아래)
         """
-        from kiwoom_order import get_tick_size, calculate_sell_price
-
         # 목표가 계산
         target_price = int(buy_price * (1 + profit_rate))
 
         # 한 틱 아래로 매도가 계산
-        sell_price = calculate_sell_price(target_price, buy_price)
+        sell_price = calculate_tick_sell_price(target_price, buy_price)
 
         logger.info(f"💰 매도가 계산:")
         logger.info(f"   매수가: {buy_price:,}원")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+검증 스크립트 일괄 실행기
+
+서로 독립적인 검증 스크립트들을 동시에 실행하고,
+각 스크립트의 출력은 섞이지 않도록 끝난 뒤 순서대로 출력합니다.
+
+사용법:
+    python run_all.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# 검증 스크립트가 있는 디렉터리 (실행 위치와 무관하게 이 파일 기준)
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# 동시에 실행할 검증 스크립트
+VALIDATION_SCRIPTS = [
+    "test_code_validation.py",
+    "test_comprehensive_parsing.py",
+]
+
+
+async def run_script(script: str) -> tuple:
+    """
+    스크립트를 별도 프로세스로 실행하고 출력을 수집
+
+    스크립트 경로와 작업 디렉터리를 SCRIPT_DIR 기준으로 지정해
+    다른 디렉터리에서 실행해도 .env/로그 파일 위치가 같도록 합니다.
+
+    Returns:
+        (종료 코드, 출력 bytes)
+    """
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, str(SCRIPT_DIR / script),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        cwd=SCRIPT_DIR,
+    )
+    output, _ = await process.communicate()
+    return process.returncode, output
+
+
+async def run_all() -> int:
+    """모든 검증 스크립트를 동시에 실행"""
+    results = await asyncio.gather(*(run_script(script) for script in VALIDATION_SCRIPTS))
+
+    failed = []
+    for script, (returncode, output) in zip(VALIDATION_SCRIPTS, results):
+        print("\n" + "#" * 80)
+        print(f"# {script}")
+        print("#" * 80)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(output)
+        sys.stdout.buffer.flush()
+
+        if returncode != 0:
+            failed.append(script)
+
+    print("\n" + "=" * 80)
+    if failed:
+        print(f"❌ 실패한 스크립트: {', '.join(failed)}")
+        return 1
+
+    print(f"✅ {len(VALIDATION_SCRIPTS)}개 검증 스크립트 모두 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(run_all()))
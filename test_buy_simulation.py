@@ -249,8 +249,8 @@ class MockOrderExecutor:
         logger.info("⏳ 매수 체결 확인 시작 (Mock)")
         logger.info(f"타임아웃: {timeout}초, 주기: {interval}초")
 
-        # Mock이므로 즉시 결과 반환 (대기 없음)
-        await asyncio.sleep(0.1)  # 최소 대기
+        # Mock이므로 즉시 결과 반환 (대기 없음, 이벤트 루프에 한 번만 양보)
+        await asyncio.sleep(0)
 
         # 미체결 주문 조회
         outstanding = self.api.get_outstanding_orders()
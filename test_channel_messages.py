@@ -6,6 +6,7 @@
 import asyncio
 import re
 import os
+import traceback
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
@@ -28,114 +29,114 @@ def to_kst(utc_datetime):
     return utc_datetime.astimezone(ZoneInfo("Asia/Seoul"))
 
 
+def _parse_price(price_text: str):
+    """콤마 제거 후 숫자일 때만 int 변환 (숫자가 없으면 None)"""
+    digits = price_text.replace(',', '')
+    if not digits.isdigit():
+        return None
+    return int(digits)
+
+
 def parse_stock_signal_old(message_text: str) -> dict:
     """
     기존 로직: 키워드 기반 파싱
     """
-    try:
-        # 매수 신호인지 확인 (두 가지 형식 지원)
-        is_ai_signal = "Ai 종목포착 시그널" in message_text or "종목포착" in message_text
-        is_buy_signal = "#매수신호" in message_text or "매수신호" in message_text
+    # 매수 신호인지 확인 (두 가지 형식 지원)
+    is_ai_signal = "Ai 종목포착 시그널" in message_text or "종목포착" in message_text
+    is_buy_signal = "#매수신호" in message_text or "매수신호" in message_text
+
+    if not is_ai_signal and not is_buy_signal:
+        return None
+
+    # 형식 1: Ai 종목포착 시그널
+    if is_ai_signal:
+        stock_pattern = r'(?:포착\s*)?종목명\s*[:：]\s*([가-힣a-zA-Z0-9＆&\s]*?)\s*\((\d{6})\)'
+        stock_match = re.search(stock_pattern, message_text)
 
-        if not is_ai_signal and not is_buy_signal:
+        if stock_match is None:
             return None
 
-        # 형식 1: Ai 종목포착 시그널
-        if is_ai_signal:
-            stock_pattern = r'(?:포착\s*)?종목명\s*[:：]\s*([가-힣a-zA-Z0-9＆&\s]*?)\s*\((\d{6})\)'
-            stock_match = re.search(stock_pattern, message_text)
-
-            if not stock_match:
-                return None
-
-            stock_name = stock_match.group(1).strip()
-            stock_code = stock_match.group(2).strip()
-
-            if not stock_name:
-                stock_name = stock_code
-
-            # 적정 매수가 추출
-            target_price = None
-            target_pattern = r'적정\s*매수가?\s*[:：]\s*([\d,]+)원?'
-            target_match = re.search(target_pattern, message_text)
-            if target_match:
-                target_price = int(target_match.group(1).replace(',', ''))
-
-            # 현재가 추출
-            current_price = None
-            current_pattern = r'(?:포착\s*)?현재가\s*[:：]\s*([\d,]+)원?'
-            current_match = re.search(current_pattern, message_text)
-            if current_match:
-                current_price = int(current_match.group(1).replace(',', ''))
-
-        # 형식 2: #매수신호
-        elif is_buy_signal:
-            stock_pattern = r'종목명\s*👉\s*([가-힣a-zA-Z0-9＆&\s]+?)\s*\((\d{6})\)'
-            stock_match = re.search(stock_pattern, message_text)
-
-            if not stock_match:
-                return None
-
-            stock_name = stock_match.group(1).strip()
-            stock_code = stock_match.group(2).strip()
-
-            # 매수가 추출
-            current_price = None
-            buy_price_pattern = r'매수가\s*👉\s*([\d,]+)원?'
-            buy_price_match = re.search(buy_price_pattern, message_text)
-            if buy_price_match:
-                current_price = int(buy_price_match.group(1).replace(',', ''))
-
-            # 매도가 추출
-            target_price = None
-            sell_price_pattern = r'매도가\s*👉\s*([\d,]+)원?'
-            sell_price_match = re.search(sell_price_pattern, message_text)
-            if sell_price_match:
-                target_price = int(sell_price_match.group(1).replace(',', ''))
-
-        return {
-            "stock_name": stock_name,
-            "stock_code": stock_code,
-            "target_price": target_price,
-            "current_price": current_price
-        }
+        stock_name = stock_match.group(1).strip()
+        stock_code = stock_match.group(2).strip()
 
-    except Exception as e:
-        return None
+        if not stock_name:
+            stock_name = stock_code
+
+        # 적정 매수가 추출
+        target_price = None
+        target_pattern = r'적정\s*매수가?\s*[:：]\s*([\d,]+)원?'
+        target_match = re.search(target_pattern, message_text)
+        if target_match is not None:
+            target_price = _parse_price(target_match.group(1))
+
+        # 현재가 추출
+        current_price = None
+        current_pattern = r'(?:포착\s*)?현재가\s*[:：]\s*([\d,]+)원?'
+        current_match = re.search(current_pattern, message_text)
+        if current_match is not None:
+            current_price = _parse_price(current_match.group(1))
+
+    # 형식 2: #매수신호
+    else:
+        stock_pattern = r'종목명\s*👉\s*([가-힣a-zA-Z0-9＆&\s]+?)\s*\((\d{6})\)'
+        stock_match = re.search(stock_pattern, message_text)
+
+        if stock_match is None:
+            return None
+
+        stock_name = stock_match.group(1).strip()
+        stock_code = stock_match.group(2).strip()
+
+        # 매수가 추출
+        current_price = None
+        buy_price_pattern = r'매수가\s*👉\s*([\d,]+)원?'
+        buy_price_match = re.search(buy_price_pattern, message_text)
+        if buy_price_match is not None:
+            current_price = _parse_price(buy_price_match.group(1))
+
+        # 매도가 추출
+        target_price = None
+        sell_price_pattern = r'매도가\s*👉\s*([\d,]+)원?'
+        sell_price_match = re.search(sell_price_pattern, message_text)
+        if sell_price_match is not None:
+            target_price = _parse_price(sell_price_match.group(1))
+
+    return {
+        "stock_name": stock_name,
+        "stock_code": stock_code,
+        "target_price": target_price,
+        "current_price": current_price
+    }
 
 
 def parse_stock_signal_new(message_text: str) -> dict:
     """
     새로운 로직: 괄호 안 6자리 숫자 기반 파싱
     """
-    try:
-        # 괄호 안의 6자리 숫자 추출
-        stock_code_pattern = r'\((\d{6})\)'
-        match = re.search(stock_code_pattern, message_text)
-
-        if not match:
-            return None
+    # 괄호 안의 6자리 숫자 추출
+    stock_code_pattern = r'\((\d{6})\)'
+    match = re.search(stock_code_pattern, message_text)
 
-        stock_code = match.group(1)
+    if match is None:
+        return None
 
-        # 종목명 추출 (괄호 앞의 텍스트)
-        stock_name = extract_stock_name(message_text, stock_code)
+    stock_code = match.group(1)
 
-        if not stock_name:
-            stock_name = stock_code
+    # 종목명 추출 (괄호 앞의 텍스트)
+    stock_name = extract_stock_name(message_text, stock_code)
 
-        # 가격 정보 추출
-        prices = extract_prices(message_text)
+    if not stock_name:
+        stock_name = stock_code
 
-        return {
-            "stock_name": stock_name,
-            "stock_code": stock_code,
-            "target_price": prices.get("target"),
-            "current_price": prices.get("current")
-        }
+    # 가격 정보 추출
+    prices = extract_prices(message_text)
 
-    except Exception as e:
-        return None
+    return {
+        "stock_name": stock_name,
+        "stock_code": stock_code,
+        "target_price": prices.get("target"),
+        "current_price": prices.get("current")
+    }
 
 
 def extract_stock_name(message_text: str, stock_code: str) -> str:
@@ -146,7 +147,7 @@ def extract_stock_name(message_text: str, stock_code: str) -> str:
     pattern = r'([가-힣a-zA-Z0-9＆&]+)\s*\(' + re.escape(stock_code) + r'\)'
     match = re.search(pattern, message_text)
 
-    if not match:
+    if match is None:
         return ""
 
     stock_name = match.group(1).strip()
@@ -173,12 +174,11 @@ def extract_prices(message_text: str) -> dict:
 
     for pattern in target_patterns:
         match = re.search(pattern, message_text)
-        if match:
-            try:
-                prices["target"] = int(match.group(1).replace(',', ''))
+        if match is not None:
+            price = _parse_price(match.group(1))
+            if price is not None:
+                prices["target"] = price
                 break
-            except:
-                pass
 
     # 현재가, 매수가 → current_price
     current_patterns = [
@@ -188,12 +188,11 @@ def extract_prices(message_text: str) -> dict:
 
     for pattern in current_patterns:
         match = re.search(pattern, message_text)
-        if match:
-            try:
-                prices["current"] = int(match.group(1).replace(',', ''))
+        if match is not None:
+            price = _parse_price(match.group(1))
+            if price is not None:
+                prices["current"] = price
                 break
-            except:
-                pass
 
     return prices
 
@@ -359,7 +358,6 @@ async def analyze_channel_messages():
 
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
-        import traceback
         traceback.print_exc()
 
     finally:
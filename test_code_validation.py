@@ -3,23 +3,71 @@
 전체 코드 검증 스크립트
 
 모든 파일의 import, 의존성, 로직을 체계적으로 검증합니다.
+
+사용법:
+    python test_code_validation.py            # 오류 메시지만 출력
+    python test_code_validation.py --verbose  # 실패 시 전체 traceback 출력
+    python test_code_validation.py --fail-fast  # 선행 검증 실패 시 나머지 생략
 """
 
+import os
 import sys
 import importlib
+import traceback
+from functools import lru_cache
 from pathlib import Path
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
-console = Console()
+# 검증 출력은 한글/이모지 위주라 repr 하이라이팅이 불필요
+console = Console(highlight=False, soft_wrap=True)
+
+# 섹션 구분선 (마크업 태그는 한 번만)
+_HDR = "[bold cyan]" + "=" * 40
+_HDR80 = "[bold cyan]" + "=" * 80
+
+# 상세 traceback 출력 여부 (--verbose 또는 STOCK_TEL_VERBOSE=true)
+VERBOSE = "--verbose" in sys.argv or os.getenv("STOCK_TEL_VERBOSE", "false").lower() == "true"
+
+# 선행 검증 실패 시 나머지 섹션 생략 여부 (--fail-fast)
+FAIL_FAST = "--fail-fast" in sys.argv
+
+# 실패하면 이후 섹션도 반드시 실패하는 선행 검증
+_CRITICAL = {"Import 의존성", "TradingConfig"}
+
+
+def _print_traceback():
+    """VERBOSE 모드일 때만 현재 예외의 전체 traceback 출력"""
+    if VERBOSE:
+        traceback.print_exc()
+
+
+def _section(title: str):
+    """섹션 헤더 출력 (구분선 + 제목 + 구분선을 한 번에)"""
+    console.print(f"\n{_HDR}\n[bold cyan]{title}\n{_HDR}")
+
+
+def _report(test_name: str, passed) -> bool:
+    """검증 항목 결과를 즉시 출력하고 bool로 반환"""
+    status = "✅" if passed else "❌"
+    console.print(f"  {status} {test_name}")
+    return bool(passed)
+
+
+# test_imports에서 로드한 모듈 (이후 섹션에서 재사용)
+_MODULES = {}
+
+
+def _module(module_name: str):
+    """test_imports에서 로드한 모듈 반환 (단독 실행 시 직접 import)"""
+    module = _MODULES.get(module_name)
+    if module is None:
+        module = _MODULES[module_name] = importlib.import_module(module_name)
+    return module
 
 
 def test_imports():
     """모든 파일의 import 검증"""
-    console.print("\n[bold cyan]=" * 40)
-    console.print("[bold cyan]1. Import 의존성 검증")
-    console.print("[bold cyan]=" * 40)
+    _section("1. Import 의존성 검증")
 
     files_to_test = [
         "config",
@@ -32,28 +80,26 @@ def test_imports():
         "auto_trading",
     ]
 
-    results = []
+    ok = True
 
+    # import는 메인 스레드에서 순서대로 (import 락 경합/부분 초기화 모듈 노출 방지)
     for module_name in files_to_test:
         try:
-            module = importlib.import_module(module_name)
+            _MODULES[module_name] = importlib.import_module(module_name)
             console.print(f"  ✅ {module_name}.py - import 성공")
-            results.append((module_name, True, None))
         except Exception as e:
             console.print(f"  ❌ {module_name}.py - import 실패: {e}")
-            results.append((module_name, False, str(e)))
+            ok = False
 
-    return all(r[1] for r in results), results
+    return ok
 
 
 def test_config():
     """TradingConfig 검증"""
-    console.print("\n[bold cyan]=" * 40)
-    console.print("[bold cyan]2. TradingConfig 검증")
-    console.print("[bold cyan]=" * 40)
+    _section("2. TradingConfig 검증")
 
     try:
-        from config import TradingConfig
+        TradingConfig = _module("config").TradingConfig
 
         # 환경변수 로드
         config = TradingConfig.from_env()
@@ -73,134 +119,111 @@ def test_config():
             ("강제 청산 시간", config.daily_force_sell_time is not None),
         ]
 
-        table = Table(title="설정 검증")
-        table.add_column("항목", style="cyan")
-        table.add_column("상태", style="bold")
-
+        # 설정 검증 결과 (한 번에 출력)
+        ok = True
+        lines = ["\n[bold]설정 검증[/bold]"]
         for check_name, passed in checks:
             status = "[green]✅ OK[/green]" if passed else "[red]❌ FAIL[/red]"
-            table.add_row(check_name, status)
+            lines.append(f"  {status}  [cyan]{check_name}[/cyan]")
+            ok = ok and bool(passed)
 
-        console.print(table)
+        console.print("\n".join(lines))
 
-        return all(c[1] for c in checks)
+        return ok
 
     except Exception as e:
         console.print(f"  ❌ TradingConfig 검증 실패: {e}")
-        import traceback
-        traceback.print_exc()
+        _print_traceback()
         return False
 
 
 def test_order_executor():
     """OrderExecutor 검증"""
-    console.print("\n[bold cyan]=" * 40)
-    console.print("[bold cyan]3. OrderExecutor 검증")
-    console.print("[bold cyan]=" * 40)
+    _section("3. OrderExecutor 검증")
 
     try:
-        from order_executor import OrderExecutor
-        from kiwoom_order import KiwoomOrderAPI
         from unittest.mock import Mock
 
-        # Mock API
-        mock_api = Mock(spec=KiwoomOrderAPI)
+        OrderExecutor = _module("order_executor").OrderExecutor
+
+        # Mock API (생성자에 참조만 전달하므로 spec 불필요)
+        mock_api = Mock()
         executor = OrderExecutor(mock_api, "12345678-01")
 
-        # 테스트 케이스
-        tests = []
+        ok = True
 
         # 1. 매수 수량 계산
         try:
             quantity = executor.calculate_buy_quantity(10000, 1000000)
-            tests.append(("매수 수량 계산", quantity > 0))
+            ok &= _report("매수 수량 계산", quantity > 0)
         except Exception as e:
-            tests.append(("매수 수량 계산", False))
             console.print(f"    ❌ 매수 수량 계산 오류: {e}")
+            ok &= _report("매수 수량 계산", False)
 
         # 2. 매도가 계산
         try:
             sell_price = executor.calculate_sell_price(10000, 0.01)
-            tests.append(("매도가 계산", sell_price > 10000))
+            ok &= _report("매도가 계산", sell_price > 10000)
         except Exception as e:
-            tests.append(("매도가 계산", False))
             console.print(f"    ❌ 매도가 계산 오류: {e}")
+            ok &= _report("매도가 계산", False)
 
         # 3. OrderExecutor 속성 확인
-        tests.append(("OrderExecutor.api 존재", hasattr(executor, 'api')))
+        ok &= _report("OrderExecutor.api 존재", hasattr(executor, 'api'))
 
-        # 결과 출력
-        for test_name, passed in tests:
-            status = "✅" if passed else "❌"
-            console.print(f"  {status} {test_name}")
-
-        return all(t[1] for t in tests)
+        return ok
 
     except Exception as e:
         console.print(f"  ❌ OrderExecutor 검증 실패: {e}")
-        import traceback
-        traceback.print_exc()
+        _print_traceback()
         return False
 
 
 def test_price_monitor():
     """PriceMonitor 검증"""
-    console.print("\n[bold cyan]=" * 40)
-    console.print("[bold cyan]4. PriceMonitor 검증")
-    console.print("[bold cyan]=" * 40)
+    _section("4. PriceMonitor 검증")
 
     try:
-        from price_monitor import PriceMonitor
-        from kiwoom_websocket import KiwoomWebSocket
-        from kiwoom_order import KiwoomOrderAPI
         from unittest.mock import Mock
 
-        # Mock 객체
-        mock_ws = Mock(spec=KiwoomWebSocket)
-        mock_api = Mock(spec=KiwoomOrderAPI)
+        PriceMonitor = _module("price_monitor").PriceMonitor
+
+        # Mock 객체 (생성자에 참조만 전달하므로 spec 불필요)
+        mock_ws = Mock()
+        mock_api = Mock()
         monitor = PriceMonitor(mock_ws, mock_api)
 
         # 테스트
-        tests = [
-            ("PriceMonitor.websocket 존재", hasattr(monitor, 'websocket')),
-            ("PriceMonitor.api 존재", hasattr(monitor, 'api')),
-            ("PriceMonitor.callbacks 존재", hasattr(monitor, 'callbacks')),
-            ("PriceMonitor.monitoring 존재", hasattr(monitor, 'monitoring')),
-        ]
-
-        for test_name, passed in tests:
-            status = "✅" if passed else "❌"
-            console.print(f"  {status} {test_name}")
+        ok = True
+        for attr_name in ('websocket', 'api', 'callbacks', 'monitoring'):
+            ok &= _report(f"PriceMonitor.{attr_name} 존재", hasattr(monitor, attr_name))
 
-        return all(t[1] for t in tests)
+        return ok
 
     except Exception as e:
         console.print(f"  ❌ PriceMonitor 검증 실패: {e}")
-        import traceback
-        traceback.print_exc()
+        _print_traceback()
         return False
 
 
 def test_trading_system_base():
     """TradingSystemBase 검증"""
-    console.print("\n[bold cyan]=" * 40)
-    console.print("[bold cyan]5. TradingSystemBase 검증")
-    console.print("[bold cyan]=" * 40)
+    _section("5. TradingSystemBase 검증")
 
     try:
-        from trading_system_base import TradingSystemBase
-        from config import TradingConfig
+        TradingSystemBase = _module("trading_system_base").TradingSystemBase
+
+        # 클래스 계층 전체의 속성 이름 (MRO 1회 순회)
+        attrs = set().union(*(vars(cls) for cls in TradingSystemBase.__mro__))
+        abstract_names = getattr(TradingSystemBase, '__abstractmethods__', frozenset())
 
         # 추상 메서드 확인
         abstract_methods = ['start_monitoring']
 
-        tests = [
-            ("TradingSystemBase is ABC", hasattr(TradingSystemBase, '__abstractmethods__')),
-        ]
+        ok = _report("TradingSystemBase is ABC", '__abstractmethods__' in attrs)
 
         for method_name in abstract_methods:
-            has_method = hasattr(TradingSystemBase, method_name)
-            tests.append((f"추상 메서드 '{method_name}' 정의됨", has_method))
+            ok &= _report(f"추상 메서드 '{method_name}' 정의됨", method_name in abstract_names)
 
         # 주요 메서드 확인
         required_methods = [
@@ -215,36 +238,26 @@ def test_trading_system_base():
         ]
 
         for method_name in required_methods:
-            has_method = hasattr(TradingSystemBase, method_name)
-            tests.append((f"메서드 '{method_name}' 존재", has_method))
+            ok &= _report(f"메서드 '{method_name}' 존재", method_name in attrs)
 
-        for test_name, passed in tests:
-            status = "✅" if passed else "❌"
-            console.print(f"  {status} {test_name}")
-
-        return all(t[1] for t in tests)
+        return ok
 
     except Exception as e:
         console.print(f"  ❌ TradingSystemBase 검증 실패: {e}")
-        import traceback
-        traceback.print_exc()
+        _print_traceback()
         return False
 
 
 def test_auto_trading():
     """AutoTrading (TelegramTradingSystem) 검증"""
-    console.print("\n[bold cyan]=" * 40)
-    console.print("[bold cyan]6. TelegramTradingSystem 검증")
-    console.print("[bold cyan]=" * 40)
+    _section("6. TelegramTradingSystem 검증")
 
     try:
-        from auto_trading import TelegramTradingSystem
-        from trading_system_base import TradingSystemBase
+        TelegramTradingSystem = _module("auto_trading").TelegramTradingSystem
+        TradingSystemBase = _module("trading_system_base").TradingSystemBase
 
         # 상속 확인
-        tests = [
-            ("TradingSystemBase 상속", issubclass(TelegramTradingSystem, TradingSystemBase)),
-        ]
+        ok = _report("TradingSystemBase 상속", issubclass(TelegramTradingSystem, TradingSystemBase))
 
         # 필수 메서드 구현 확인
         required_methods = [
@@ -253,76 +266,68 @@ def test_auto_trading():
             'handle_telegram_signal',
         ]
 
-        for method_name in required_methods:
-            has_method = hasattr(TelegramTradingSystem, method_name)
-            tests.append((f"메서드 '{method_name}' 구현됨", has_method))
+        attrs = set().union(*(vars(cls) for cls in TelegramTradingSystem.__mro__))
 
-        for test_name, passed in tests:
-            status = "✅" if passed else "❌"
-            console.print(f"  {status} {test_name}")
+        for method_name in required_methods:
+            ok &= _report(f"메서드 '{method_name}' 구현됨", method_name in attrs)
 
-        return all(t[1] for t in tests)
+        return ok
 
     except Exception as e:
         console.print(f"  ❌ TelegramTradingSystem 검증 실패: {e}")
-        import traceback
-        traceback.print_exc()
+        _print_traceback()
         return False
 
 
 def test_exceptions():
     """커스텀 예외 검증"""
-    console.print("\n[bold cyan]=" * 40)
-    console.print("[bold cyan]7. 커스텀 예외 검증")
-    console.print("[bold cyan]=" * 40)
+    _section("7. 커스텀 예외 검증")
 
     try:
-        from exceptions import (
-            TradingException,
-            TradingNetworkError,
-            TradingTimeoutError,
-            TradingAuthError,
-            TradingOrderError,
-            TradingDataError,
-            get_exception_type,
-            format_exception_message,
-        )
+        exceptions = _module("exceptions")
+        TradingException = exceptions.TradingException
+        TradingNetworkError = exceptions.TradingNetworkError
+        TradingTimeoutError = exceptions.TradingTimeoutError
+        TradingAuthError = exceptions.TradingAuthError
+        TradingOrderError = exceptions.TradingOrderError
+        TradingDataError = exceptions.TradingDataError
+        get_exception_type = exceptions.get_exception_type
+        format_exception_message = exceptions.format_exception_message
 
         # 예외 계층 구조 확인
-        tests = [
-            ("TradingNetworkError is TradingException", issubclass(TradingNetworkError, TradingException)),
-            ("TradingTimeoutError is TradingException", issubclass(TradingTimeoutError, TradingException)),
-            ("TradingAuthError is TradingException", issubclass(TradingAuthError, TradingException)),
-            ("TradingOrderError is TradingException", issubclass(TradingOrderError, TradingException)),
-            ("TradingDataError is TradingException", issubclass(TradingDataError, TradingException)),
-        ]
+        ok = True
+        for exc_class in (TradingNetworkError, TradingTimeoutError, TradingAuthError,
+                          TradingOrderError, TradingDataError):
+            ok &= _report(f"{exc_class.__name__} is TradingException", issubclass(exc_class, TradingException))
 
         # 유틸리티 함수 확인
-        tests.append(("get_exception_type 함수 존재", callable(get_exception_type)))
-        tests.append(("format_exception_message 함수 존재", callable(format_exception_message)))
-
-        for test_name, passed in tests:
-            status = "✅" if passed else "❌"
-            console.print(f"  {status} {test_name}")
+        ok &= _report("get_exception_type 함수 존재", callable(get_exception_type))
+        ok &= _report("format_exception_message 함수 존재", callable(format_exception_message))
 
-        return all(t[1] for t in tests)
+        return ok
 
     except Exception as e:
         console.print(f"  ❌ 커스텀 예외 검증 실패: {e}")
-        import traceback
-        traceback.print_exc()
+        _print_traceback()
         return False
 
 
+@lru_cache(maxsize=1)
+def _read_env_file():
+    """.env 파일 내용을 bytes로 1회 읽어 캐싱 (파일이 없으면 None)"""
+    try:
+        return Path(".env").read_bytes()
+    except FileNotFoundError:
+        return None
+
+
 def check_env_file():
     """환경 변수 파일 확인"""
-    console.print("\n[bold cyan]=" * 40)
-    console.print("[bold cyan]8. 환경 변수 파일 확인")
-    console.print("[bold cyan]=" * 40)
+    _section("8. 환경 변수 파일 확인")
 
-    env_file = Path(".env")
+    content = _read_env_file()
 
-    if not env_file.exists():
+    if content is None:
         console.print("  ❌ .env 파일이 없습니다!")
         return False
 
@@ -340,21 +345,25 @@ def check_env_file():
         "BALANCE_CHECK_INTERVAL",
     ]
 
-    with open(env_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # 정의된 변수명 집합 (주석 제외, 다른 변수의 값에 포함된 이름은 무시)
+    # 변수명은 ASCII이므로 디코딩 없이 bytes 그대로 비교
+    defined_keys = {
+        line.split(b'=', 1)[0].strip()
+        for line in content.splitlines()
+        if b'=' in line and not line.lstrip().startswith(b'#')
+    }
 
-    tests = []
+    ok = True
     for var in required_vars:
-        exists = var in content
-        tests.append((var, exists))
-        status = "✅" if exists else "❌"
-        console.print(f"  {status} {var}")
+        ok &= _report(var, var.encode() in defined_keys)
 
-    return all(t[1] for t in tests)
+    return ok
 
 
 def main():
     """메인 검증 함수"""
+    from rich.panel import Panel
+
     console.print("\n")
     console.print(Panel.fit(
         "[bold blue]자동매매 시스템 전체 코드 검증[/bold blue]",
@@ -374,42 +383,50 @@ def main():
 
     results = []
 
-    for test_name, test_func in test_functions:
+    for index, (test_name, test_func) in enumerate(test_functions):
         try:
             result = test_func()
             results.append((test_name, result))
         except Exception as e:
             console.print(f"\n[bold red]❌ {test_name} 테스트 중 예외 발생: {e}[/bold red]")
-            import traceback
-            traceback.print_exc()
+            _print_traceback()
+            result = False
             results.append((test_name, False))
 
+        if FAIL_FAST and not result and test_name in _CRITICAL:
+            console.print(f"\n[bold yellow]⏭️ {test_name} 실패로 나머지 검증을 생략합니다 (--fail-fast)[/bold yellow]")
+            # 생략된 항목은 None으로 기록
+            results.extend((name, None) for name, _ in test_functions[index + 1:])
+            break
+
     # 최종 결과
-    console.print("\n")
-    console.print("[bold cyan]=" * 80)
-    console.print("[bold cyan]최종 검증 결과")
-    console.print("[bold cyan]=" * 80)
+    console.print(f"\n\n{_HDR80}\n[bold cyan]최종 검증 결과\n{_HDR80}")
 
-    result_table = Table(title="코드 검증 결과", show_header=True, header_style="bold magenta")
-    result_table.add_column("검증 항목", style="cyan", width=30)
-    result_table.add_column("결과", style="bold", width=15)
+    # 코드 검증 결과 (한 번에 출력)
+    lines = ["[bold magenta]코드 검증 결과[/bold magenta]"]
 
     passed_count = 0
     failed_count = 0
+    skipped_count = 0
 
     for test_name, result in results:
-        if result:
-            result_table.add_row(test_name, "[green]✅ PASS[/green]")
+        if result is None:
+            lines.append(f"  [yellow]⏭️ SKIP[/yellow]  [cyan]{test_name}[/cyan]")
+            skipped_count += 1
+        elif result:
+            lines.append(f"  [green]✅ PASS[/green]  [cyan]{test_name}[/cyan]")
             passed_count += 1
         else:
-            result_table.add_row(test_name, "[red]❌ FAIL[/red]")
+            lines.append(f"  [red]❌ FAIL[/red]  [cyan]{test_name}[/cyan]")
             failed_count += 1
 
-    console.print(result_table)
+    console.print("\n".join(lines))
 
     console.print(f"\n[bold]총 {len(results)}개 검증:[/bold]")
     console.print(f"  [green]✅ 통과: {passed_count}개[/green]")
     console.print(f"  [red]❌ 실패: {failed_count}개[/red]")
+    if skipped_count:
+        console.print(f"  [yellow]⏭️ 생략: {skipped_count}개[/yellow]")
 
     if failed_count == 0:
         console.print("\n[bold green]🎉 모든 코드 검증 통과![/bold green]")
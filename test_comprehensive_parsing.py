@@ -3,24 +3,30 @@
 - 정상적인 메시지 (종목명 있음)
 - 오류 메시지 (종목명 비어있음)
 """
+import io
 import re
 import sys
 sys.path.append('/home/ralph/work/python/stock_tel')
 
+# 파싱 정규식 (모듈 로드 시 1회 컴파일)
+# 종목명이 비어있어도 종목코드만 있으면 매수 가능하도록 0개 이상 허용
+# 종목명은 '단어(공백 단어)*' 형태로만 매칭해 공백 구간에서 역추적이 폭증하지 않도록 함
+_STOCK_RE = re.compile(r'(?:포착\s*)?종목명\s*[:：]\s*([가-힣a-zA-Z0-9＆&]*(?:\s+[가-힣a-zA-Z0-9＆&]+)*)\s*\((\d{6})\)')
+_TARGET_RE = re.compile(r'적정\s*매수가?\s*[:：]\s*([\d,]+)원?')
+_CURRENT_RE = re.compile(r'(?:포착\s*)?현재가\s*[:：]\s*([\d,]+)원?')
+
 
 def parse_stock_signal(message_text: str) -> dict:
     """
     테스트용 파싱 함수 (auto_trading.py와 동일한 로직)
     """
     try:
-        # 매수 신호인지 확인
-        if "Ai 종목포착 시그널" not in message_text and "종목포착" not in message_text:
+        # 매수 신호인지 확인 ("Ai 종목포착 시그널"도 "종목포착"을 포함)
+        if "종목포착" not in message_text:
             return None
 
         # 종목명과 종목코드 추출
-        # 종목명이 비어있어도 종목코드만 있으면 매수 가능하도록 *? 사용 (0개 이상)
-        stock_pattern = r'(?:포착\s*)?종목명\s*[:：]\s*([가-힣a-zA-Z0-9＆&\s]*?)\s*\((\d{6})\)'
-        stock_match = re.search(stock_pattern, message_text)
+        stock_match = _STOCK_RE.search(message_text)
 
         if not stock_match:
             print("⚠️ 종목명/종목코드를 찾을 수 없습니다")
@@ -36,15 +42,13 @@ def parse_stock_signal(message_text: str) -> dict:
 
         # 적정 매수가 추출 (선택)
         target_price = None
-        target_pattern = r'적정\s*매수가?\s*[:：]\s*([\d,]+)원?'
-        target_match = re.search(target_pattern, message_text)
+        target_match = _TARGET_RE.search(message_text)
         if target_match:
             target_price = int(target_match.group(1).replace(',', ''))
 
         # 현재가 추출 (선택)
         current_price = None
-        current_pattern = r'(?:포착\s*)?현재가\s*[:：]\s*([\d,]+)원?'
-        current_match = re.search(current_pattern, message_text)
+        current_match = _CURRENT_RE.search(message_text)
         if current_match:
             current_price = int(current_match.group(1).replace(',', ''))
 
@@ -77,13 +81,19 @@ def test_case(title: str, message: str, expected: dict) -> bool:
     Returns:
         True if all checks pass, False otherwise
     """
-    print("\n" + "=" * 80)
-    print(f"📋 {title}")
-    print("=" * 80)
-    print("\n📨 테스트 메시지:")
-    for line in message.split('\n'):
-        print(f"   {line}")
-    print("\n" + "-" * 80)
+    out = io.StringIO()
+
+    print("\n" + "=" * 80, file=out)
+    print(f"📋 {title}", file=out)
+    print("=" * 80, file=out)
+    print("\n📨 테스트 메시지:", file=out)
+    print("   " + message.replace("\n", "\n   "), file=out)
+    print("\n" + "-" * 80, file=out)
+
+    # 파싱 함수가 직접 출력하므로 헤더를 먼저 내보냄
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
+    out = io.StringIO()
 
     # 파싱 실행
     result = parse_stock_signal(message)
@@ -93,91 +103,98 @@ def test_case(title: str, message: str, expected: dict) -> bool:
         return False
 
     # 결과 출력
-    print(f"\n📊 파싱 결과:")
-    print(f"   종목명: {result['stock_name']}")
-    print(f"   종목코드: {result['stock_code']}")
-    print(f"   적정 매수가: {result['target_price']}")
-    print(f"   현재가: {result['current_price']}")
+    print(f"\n📊 파싱 결과:", file=out)
+    print(f"   종목명: {result['stock_name']}", file=out)
+    print(f"   종목코드: {result['stock_code']}", file=out)
+    print(f"   적정 매수가: {result['target_price']}", file=out)
+    print(f"   현재가: {result['current_price']}", file=out)
 
     # 검증
-    print(f"\n🔎 검증:")
-    checks = []
+    print(f"\n🔎 검증:", file=out)
+    ok = True
 
     for key, expected_value in expected.items():
         actual_value = result.get(key)
         if actual_value == expected_value:
-            print(f"   ✅ {key}: {actual_value} (일치)")
-            checks.append(True)
+            print(f"   ✅ {key}: {actual_value} (일치)", file=out)
         else:
-            print(f"   ❌ {key}: 예상 {expected_value}, 실제 {actual_value}")
-            checks.append(False)
+            print(f"   ❌ {key}: 예상 {expected_value}, 실제 {actual_value}", file=out)
+            ok = False
 
-    if all(checks):
-        print(f"\n✅ {title} 통과!")
-        return True
+    if ok:
+        print(f"\n✅ {title} 통과!", file=out)
     else:
-        print(f"\n❌ {title} 실패!")
-        return False
+        print(f"\n❌ {title} 실패!", file=out)
 
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
+    return ok
 
-def main():
-    """종합 테스트 실행"""
-    print("\n" + "🔬" * 40)
-    print("종목명 파싱 종합 테스트")
-    print("🔬" * 40)
-
-    test_results = []
 
+# 테스트 케이스: (요약 이름, 제목, 메시지, 기대값)
+TEST_CASES = [
     # 테스트 1: 정상적인 메시지 (종목명 있음)
-    message1 = """⭐️ Ai 종목포착 시그널
+    (
+        "정상 메시지",
+        "테스트 1: 정상 메시지 (종목명 있음)",
+        """⭐️ Ai 종목포착 시그널
 ￣￣￣￣￣￣￣￣￣￣￣￣￣￣￣
 포착 종목명 : 중앙첨단소재 (051980)
 적정 매수가 : 3,430원 👉 7.36%
-포착 현재가 : 3,395원 👉 6.26%"""
-
-    expected1 = {
-        "stock_name": "중앙첨단소재",
-        "stock_code": "051980",
-        "target_price": 3430,
-        "current_price": 3395
-    }
-
-    result1 = test_case("테스트 1: 정상 메시지 (종목명 있음)", message1, expected1)
-    test_results.append(("정상 메시지", result1))
-
+포착 현재가 : 3,395원 👉 6.26%""",
+        {
+            "stock_name": "중앙첨단소재",
+            "stock_code": "051980",
+            "target_price": 3430,
+            "current_price": 3395
+        },
+    ),
     # 테스트 2: 종목명 비어있는 메시지
-    message2 = """■ Ai 종목포착 시그널
+    (
+        "오류 메시지",
+        "테스트 2: 오류 메시지 (종목명 비어있음)",
+        """■ Ai 종목포착 시그널
 ￣￣￣￣￣￣￣￣￣￣￣￣￣￣￣
 포착 종목명 :  (051980)
 적정 매수가 : 원 👉 %
-포착 현재가 : 3,395원 👉 6.26%"""
-
-    expected2 = {
-        "stock_name": "051980",  # 종목코드로 대체됨
-        "stock_code": "051980",
-        "target_price": None,    # 빈 값은 None
-        "current_price": 3395
-    }
-
-    result2 = test_case("테스트 2: 오류 메시지 (종목명 비어있음)", message2, expected2)
-    test_results.append(("오류 메시지", result2))
-
+포착 현재가 : 3,395원 👉 6.26%""",
+        {
+            "stock_name": "051980",  # 종목코드로 대체됨
+            "stock_code": "051980",
+            "target_price": None,    # 빈 값은 None
+            "current_price": 3395
+        },
+    ),
     # 테스트 3: 다른 정상 메시지
-    message3 = """⭐️ Ai 종목포착 시그널
+    (
+        "다른 종목",
+        "테스트 3: 정상 메시지 (다른 종목)",
+        """⭐️ Ai 종목포착 시그널
 ￣￣￣￣￣￣￣￣￣￣￣￣￣￣￣
 포착 종목명 : 유일에너테크 (340930)
 적정 매수가 : 2,870원 👉 6.49%
-포착 현재가 : 2,860원 👉 6.12%"""
+포착 현재가 : 2,860원 👉 6.12%""",
+        {
+            "stock_name": "유일에너테크",
+            "stock_code": "340930",
+            "target_price": 2870,
+            "current_price": 2860
+        },
+    ),
+]
+
 
-    expected3 = {
-        "stock_name": "유일에너테크",
-        "stock_code": "340930",
-        "target_price": 2870,
-        "current_price": 2860
-    }
+def main():
+    """종합 테스트 실행"""
+    print("\n" + "🔬" * 40)
+    print("종목명 파싱 종합 테스트")
+    print("🔬" * 40)
+
+    test_results = []
 
-    result3 = test_case("테스트 3: 정상 메시지 (다른 종목)", message3, expected3)
-    test_results.append(("다른 종목", result3))
+    for short_name, title, message, expected in TEST_CASES:
+        passed = test_case(title, message, expected)
+        test_results.append((short_name, passed))
 
     # 최종 결과 요약
     print("\n" + "=" * 80)
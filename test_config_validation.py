@@ -9,9 +9,13 @@ config.py 검증 테스트
 - validate() 메서드 동작 확인
 """
 
+import dataclasses
 import os
 import logging
+import typing
 from datetime import datetime
+from functools import lru_cache
+from unittest.mock import patch
 from config import TradingConfig
 
 # 로깅 설정
@@ -21,63 +25,75 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 구분선
+_DIVIDER = "=" * 80
+
+
+@lru_cache(maxsize=1)
+def _get_config() -> TradingConfig:
+    """환경변수에서 Config를 1회만 로드하여 테스트 간 공유"""
+    return TradingConfig.from_env()
+
 
 def test_config_load():
     """환경변수에서 Config 로드 테스트"""
-    logger.info("=" * 80)
-    logger.info("🧪 테스트 1: 환경변수에서 Config 로드")
-    logger.info("=" * 80)
+    logger.info(f"{_DIVIDER}\n🧪 테스트 1: 환경변수에서 Config 로드\n{_DIVIDER}")
 
     try:
-        config = TradingConfig.from_env()
-        logger.info("✅ Config 로드 성공")
-
-        # 필수 필드 확인
-        logger.info("\n📋 필수 계좌 정보:")
-        logger.info(f"   account_no: {config.account_no}")
-        logger.info(f"   max_investment: {config.max_investment:,}원")
-
-        logger.info("\n📋 수익률 설정:")
-        logger.info(f"   target_profit_rate: {config.target_profit_rate*100:.2f}% (소수: {config.target_profit_rate})")
-        logger.info(f"   stop_loss_rate: {config.stop_loss_rate*100:.2f}% (소수: {config.stop_loss_rate})")
-        logger.info(f"   stop_loss_delay_minutes: {config.stop_loss_delay_minutes}분")
-
-        logger.info("\n📋 매수 시간 설정:")
-        logger.info(f"   buy_start_time: {config.buy_start_time}")
-        logger.info(f"   buy_end_time: {config.buy_end_time}")
-
-        logger.info("\n📋 매도 설정:")
-        logger.info(f"   enable_sell_monitoring: {config.enable_sell_monitoring}")
-        logger.info(f"   enable_stop_loss: {config.enable_stop_loss}")
-        logger.info(f"   enable_daily_force_sell: {config.enable_daily_force_sell}")
-        logger.info(f"   daily_force_sell_time: {config.daily_force_sell_time}")
-
-        logger.info("\n📋 미체결 처리 설정:")
-        logger.info(f"   cancel_outstanding_on_failure: {config.cancel_outstanding_on_failure}")
-        logger.info(f"   outstanding_check_timeout: {config.outstanding_check_timeout}초")
-        logger.info(f"   outstanding_check_interval: {config.outstanding_check_interval}초")
-
-        logger.info("\n📋 체결 검증 설정:")
-        logger.info(f"   enable_lazy_verification: {config.enable_lazy_verification}")
-
-        logger.info("\n📋 주기적 계좌 조회 설정:")
-        logger.info(f"   balance_check_interval: {config.balance_check_interval}초")
-
-        logger.info("\n📋 매수 주문 타입 설정 (v1.6.0):")
-        logger.info(f"   buy_order_type: {config.buy_order_type}")
-        logger.info(f"   buy_execution_timeout: {config.buy_execution_timeout}초")
-        logger.info(f"   buy_execution_check_interval: {config.buy_execution_check_interval}초")
-        logger.info(f"   buy_fallback_to_market: {config.buy_fallback_to_market}")
-
-        logger.info("\n📋 디버그 모드:")
-        logger.info(f"   debug_mode: {config.debug_mode}")
-
-        logger.info("\n📋 Telegram 설정 (선택적):")
-        logger.info(f"   api_id: {config.api_id}")
-        logger.info(f"   api_hash: {'*' * 10 if config.api_hash else None}")
-        logger.info(f"   session_name: {config.session_name}")
-        logger.info(f"   source_channel: {config.source_channel}")
-        logger.info(f"   target_channel: {config.target_channel if config.target_channel else '(비활성화)'}")
+        config = _get_config()
+
+        # 설정값 출력 (여러 줄을 모아 한 번에 로깅)
+        lines = [
+            "✅ Config 로드 성공",
+
+            # 필수 필드 확인
+            "\n📋 필수 계좌 정보:",
+            f"   account_no: {config.account_no}",
+            f"   max_investment: {config.max_investment:,}원",
+
+            "\n📋 수익률 설정:",
+            f"   target_profit_rate: {config.target_profit_rate*100:.2f}% (소수: {config.target_profit_rate})",
+            f"   stop_loss_rate: {config.stop_loss_rate*100:.2f}% (소수: {config.stop_loss_rate})",
+            f"   stop_loss_delay_minutes: {config.stop_loss_delay_minutes}분",
+
+            "\n📋 매수 시간 설정:",
+            f"   buy_start_time: {config.buy_start_time}",
+            f"   buy_end_time: {config.buy_end_time}",
+
+            "\n📋 매도 설정:",
+            f"   enable_sell_monitoring: {config.enable_sell_monitoring}",
+            f"   enable_stop_loss: {config.enable_stop_loss}",
+            f"   enable_daily_force_sell: {config.enable_daily_force_sell}",
+            f"   daily_force_sell_time: {config.daily_force_sell_time}",
+
+            "\n📋 미체결 처리 설정:",
+            f"   cancel_outstanding_on_failure: {config.cancel_outstanding_on_failure}",
+            f"   outstanding_check_timeout: {config.outstanding_check_timeout}초",
+            f"   outstanding_check_interval: {config.outstanding_check_interval}초",
+
+            "\n📋 체결 검증 설정:",
+            f"   enable_lazy_verification: {config.enable_lazy_verification}",
+
+            "\n📋 주기적 계좌 조회 설정:",
+            f"   balance_check_interval: {config.balance_check_interval}초",
+
+            "\n📋 매수 주문 타입 설정 (v1.6.0):",
+            f"   buy_order_type: {config.buy_order_type}",
+            f"   buy_execution_timeout: {config.buy_execution_timeout}초",
+            f"   buy_execution_check_interval: {config.buy_execution_check_interval}초",
+            f"   buy_fallback_to_market: {config.buy_fallback_to_market}",
+
+            "\n📋 디버그 모드:",
+            f"   debug_mode: {config.debug_mode}",
+
+            "\n📋 Telegram 설정 (선택적):",
+            f"   api_id: {config.api_id}",
+            f"   api_hash: {'*' * 10 if config.api_hash else None}",
+            f"   session_name: {config.session_name}",
+            f"   source_channel: {config.source_channel}",
+            f"   target_channel: {config.target_channel if config.target_channel else '(비활성화)'}",
+        ]
+        logger.info("\n".join(lines))
 
         return True
 
@@ -95,7 +111,7 @@ def test_config_validation():
     logger.info("=" * 80)
 
     try:
-        config = TradingConfig.from_env()
+        config = _get_config()
         config.validate()
         logger.info("✅ Config 검증 통과")
         return True
@@ -111,6 +127,17 @@ def test_config_validation():
         return False
 
 
+# 로그에 값을 그대로 출력하지 않을 필드
+_SECRET_FIELDS = {"api_hash"}
+
+
+def _allowed_types(annotation) -> tuple:
+    """타입 힌트에서 허용 타입 튜플 추출 (Optional[X] → (X, NoneType))"""
+    if typing.get_origin(annotation) is typing.Union:
+        return typing.get_args(annotation)
+    return (annotation,)
+
+
 def test_config_types():
     """Config 필드 타입 검증"""
     logger.info("\n" + "=" * 80)
@@ -118,39 +145,25 @@ def test_config_types():
     logger.info("=" * 80)
 
     try:
-        config = TradingConfig.from_env()
-
-        # 타입 검증
-        type_checks = [
-            ("account_no", str, config.account_no),
-            ("max_investment", int, config.max_investment),
-            ("target_profit_rate", float, config.target_profit_rate),
-            ("stop_loss_rate", float, config.stop_loss_rate),
-            ("stop_loss_delay_minutes", int, config.stop_loss_delay_minutes),
-            ("buy_start_time", str, config.buy_start_time),
-            ("buy_end_time", str, config.buy_end_time),
-            ("enable_sell_monitoring", bool, config.enable_sell_monitoring),
-            ("enable_stop_loss", bool, config.enable_stop_loss),
-            ("enable_daily_force_sell", bool, config.enable_daily_force_sell),
-            ("daily_force_sell_time", str, config.daily_force_sell_time),
-            ("cancel_outstanding_on_failure", bool, config.cancel_outstanding_on_failure),
-            ("outstanding_check_timeout", int, config.outstanding_check_timeout),
-            ("outstanding_check_interval", int, config.outstanding_check_interval),
-            ("enable_lazy_verification", bool, config.enable_lazy_verification),
-            ("balance_check_interval", int, config.balance_check_interval),
-            ("buy_order_type", str, config.buy_order_type),
-            ("buy_execution_timeout", int, config.buy_execution_timeout),
-            ("buy_execution_check_interval", int, config.buy_execution_check_interval),
-            ("buy_fallback_to_market", bool, config.buy_fallback_to_market),
-            ("debug_mode", bool, config.debug_mode),
-        ]
+        config = _get_config()
+
+        # 타입 검증 (dataclass 필드 선언을 기준으로 자동 생성)
+        # bool은 int의 하위 클래스이므로 isinstance 대신 type() is 로 엄격 비교
+        hints = typing.get_type_hints(TradingConfig)
 
         all_passed = True
-        for field_name, expected_type, value in type_checks:
-            if isinstance(value, expected_type):
-                logger.info(f"   ✅ {field_name}: {expected_type.__name__} (값: {value})")
+        for field in dataclasses.fields(TradingConfig):
+            expected_types = _allowed_types(hints[field.name])
+            value = getattr(config, field.name)
+            type_names = "/".join(t.__name__ for t in expected_types)
+
+            # 민감 정보는 값 대신 마스킹 문자열 출력
+            shown = "*" * 10 if field.name in _SECRET_FIELDS and value is not None else value
+
+            if type(value) in expected_types:
+                logger.info(f"   ✅ {field.name}: {type_names} (값: {shown})")
             else:
-                logger.error(f"   ❌ {field_name}: 예상 타입={expected_type.__name__}, 실제 타입={type(value).__name__}, 값={value}")
+                logger.error(f"   ❌ {field.name}: 예상 타입={type_names}, 실제 타입={type(value).__name__}, 값={shown}")
                 all_passed = False
 
         return all_passed
@@ -162,6 +175,80 @@ def test_config_types():
         return False
 
 
+def _check_account_no(config: TradingConfig):
+    """account_no 형식 (12345678-01)"""
+    if "-" not in config.account_no:
+        raise AssertionError(f"account_no 형식 오류: {config.account_no}")
+    logger.info(f"   ✅ account_no 형식: {config.account_no}")
+
+
+def _check_investment(config: TradingConfig):
+    """max_investment > 0"""
+    if config.max_investment <= 0:
+        raise AssertionError(f"max_investment: {config.max_investment} (<= 0)")
+    logger.info(f"   ✅ max_investment: {config.max_investment:,}원 (> 0)")
+
+
+def _check_rates(config: TradingConfig):
+    """target_profit_rate > 0, stop_loss_rate < 0"""
+    if config.target_profit_rate <= 0:
+        raise AssertionError(f"target_profit_rate: {config.target_profit_rate*100:.2f}% (<= 0)")
+    logger.info(f"   ✅ target_profit_rate: {config.target_profit_rate*100:.2f}% (> 0)")
+
+    if config.stop_loss_rate >= 0:
+        raise AssertionError(f"stop_loss_rate: {config.stop_loss_rate*100:.2f}% (>= 0)")
+    logger.info(f"   ✅ stop_loss_rate: {config.stop_loss_rate*100:.2f}% (< 0)")
+
+
+def _check_times(config: TradingConfig):
+    """시간 형식 (HH:MM)"""
+    time_fields = [
+        ("buy_start_time", config.buy_start_time),
+        ("buy_end_time", config.buy_end_time),
+        ("daily_force_sell_time", config.daily_force_sell_time)
+    ]
+
+    for field_name, time_str in time_fields:
+        parts = time_str.split(":")
+        if len(parts) != 2 or not (parts[0].isdigit() and parts[1].isdigit()):
+            raise AssertionError(f"{field_name}: {time_str} (형식 오류)")
+
+        hour, minute = int(parts[0]), int(parts[1])
+        if not (0 <= hour <= 23 and 0 <= minute <= 59):
+            raise AssertionError(f"{field_name}: {time_str} (시간 범위 오류)")
+
+        logger.info(f"   ✅ {field_name}: {time_str} (HH:MM 형식)")
+
+
+def _check_order_type(config: TradingConfig):
+    """buy_order_type 값 확인"""
+    if config.buy_order_type not in ["market", "limit_plus_one_tick"]:
+        raise AssertionError(f"buy_order_type: {config.buy_order_type} (유효하지 않은 값)")
+    logger.info(f"   ✅ buy_order_type: {config.buy_order_type}")
+
+
+def _check_timeouts(config: TradingConfig):
+    """timeout/interval > 0"""
+    if config.outstanding_check_timeout <= 0:
+        raise AssertionError(f"outstanding_check_timeout: {config.outstanding_check_timeout}초 (<= 0)")
+    logger.info(f"   ✅ outstanding_check_timeout: {config.outstanding_check_timeout}초")
+
+    if config.outstanding_check_interval <= 0:
+        raise AssertionError(f"outstanding_check_interval: {config.outstanding_check_interval}초 (<= 0)")
+    logger.info(f"   ✅ outstanding_check_interval: {config.outstanding_check_interval}초")
+
+
+# 값 검증 순서 (첫 실패 시 중단)
+_VALUE_CHECKS = [
+    _check_account_no,
+    _check_investment,
+    _check_rates,
+    _check_times,
+    _check_order_type,
+    _check_timeouts,
+]
+
+
 def test_config_values():
     """Config 값 유효성 검증"""
     logger.info("\n" + "=" * 80)
@@ -169,83 +256,16 @@ def test_config_values():
     logger.info("=" * 80)
 
     try:
-        config = TradingConfig.from_env()
-
-        all_passed = True
-
-        # 1. account_no 형식 (12345678-01)
-        if "-" in config.account_no:
-            logger.info(f"   ✅ account_no 형식: {config.account_no}")
-        else:
-            logger.error(f"   ❌ account_no 형식 오류: {config.account_no}")
-            all_passed = False
-
-        # 2. max_investment > 0
-        if config.max_investment > 0:
-            logger.info(f"   ✅ max_investment: {config.max_investment:,}원 (> 0)")
-        else:
-            logger.error(f"   ❌ max_investment: {config.max_investment} (<= 0)")
-            all_passed = False
-
-        # 3. target_profit_rate > 0
-        if config.target_profit_rate > 0:
-            logger.info(f"   ✅ target_profit_rate: {config.target_profit_rate*100:.2f}% (> 0)")
-        else:
-            logger.error(f"   ❌ target_profit_rate: {config.target_profit_rate*100:.2f}% (<= 0)")
-            all_passed = False
-
-        # 4. stop_loss_rate < 0
-        if config.stop_loss_rate < 0:
-            logger.info(f"   ✅ stop_loss_rate: {config.stop_loss_rate*100:.2f}% (< 0)")
-        else:
-            logger.error(f"   ❌ stop_loss_rate: {config.stop_loss_rate*100:.2f}% (>= 0)")
-            all_passed = False
-
-        # 5. 시간 형식 (HH:MM)
-        time_fields = [
-            ("buy_start_time", config.buy_start_time),
-            ("buy_end_time", config.buy_end_time),
-            ("daily_force_sell_time", config.daily_force_sell_time)
-        ]
+        config = _get_config()
 
-        for field_name, time_str in time_fields:
-            try:
-                parts = time_str.split(":")
-                if len(parts) == 2:
-                    hour, minute = int(parts[0]), int(parts[1])
-                    if 0 <= hour <= 23 and 0 <= minute <= 59:
-                        logger.info(f"   ✅ {field_name}: {time_str} (HH:MM 형식)")
-                    else:
-                        logger.error(f"   ❌ {field_name}: {time_str} (시간 범위 오류)")
-                        all_passed = False
-                else:
-                    logger.error(f"   ❌ {field_name}: {time_str} (형식 오류)")
-                    all_passed = False
-            except Exception as e:
-                logger.error(f"   ❌ {field_name}: {time_str} (파싱 오류: {e})")
-                all_passed = False
+        for check in _VALUE_CHECKS:
+            check(config)
 
-        # 6. buy_order_type 값 확인
-        if config.buy_order_type in ["market", "limit_plus_one_tick"]:
-            logger.info(f"   ✅ buy_order_type: {config.buy_order_type}")
-        else:
-            logger.error(f"   ❌ buy_order_type: {config.buy_order_type} (유효하지 않은 값)")
-            all_passed = False
-
-        # 7. timeout/interval > 0
-        if config.outstanding_check_timeout > 0:
-            logger.info(f"   ✅ outstanding_check_timeout: {config.outstanding_check_timeout}초")
-        else:
-            logger.error(f"   ❌ outstanding_check_timeout: {config.outstanding_check_timeout}초 (<= 0)")
-            all_passed = False
-
-        if config.outstanding_check_interval > 0:
-            logger.info(f"   ✅ outstanding_check_interval: {config.outstanding_check_interval}초")
-        else:
-            logger.error(f"   ❌ outstanding_check_interval: {config.outstanding_check_interval}초 (<= 0)")
-            all_passed = False
+        return True
 
-        return all_passed
+    except AssertionError as e:
+        logger.error(f"   ❌ {e}")
+        return False
 
     except Exception as e:
         logger.error(f"❌ 값 검증 중 오류: {e}")
@@ -261,7 +281,7 @@ def test_config_str():
     logger.info("=" * 80)
 
     try:
-        config = TradingConfig.from_env()
+        config = _get_config()
         config_str = str(config)
 
         logger.info("\n" + config_str)
@@ -279,27 +299,19 @@ def test_env_missing_fields():
     logger.info("🧪 테스트 6: 필수 환경변수 누락 처리")
     logger.info("=" * 80)
 
-    # ACCOUNT_NO 백업 및 삭제
-    original_account_no = os.getenv("ACCOUNT_NO")
-
-    try:
-        # ACCOUNT_NO 삭제
-        if "ACCOUNT_NO" in os.environ:
-            del os.environ["ACCOUNT_NO"]
+    # ACCOUNT_NO만 제거한 격리된 환경에서 검증 (종료 시 os.environ 전체 원상복구)
+    # 공유 Config(_get_config)는 사용하지 않으므로 캐시에 영향 없음
+    with patch.dict(os.environ):
+        os.environ.pop("ACCOUNT_NO", None)
 
         try:
-            config = TradingConfig.from_env(load_dotenv_first=False)
+            TradingConfig.from_env(load_dotenv_first=False)
             logger.error("❌ ACCOUNT_NO 누락 시 ValueError가 발생해야 하는데 발생하지 않음")
             return False
         except ValueError as e:
             logger.info(f"✅ 필수 환경변수 누락 시 ValueError 발생: {e}")
             return True
 
-    finally:
-        # ACCOUNT_NO 복원
-        if original_account_no:
-            os.environ["ACCOUNT_NO"] = original_account_no
-
 
 def main():
     """메인 테스트 실행"""
@@ -328,24 +340,21 @@ def main():
     # 테스트 6: 필수 환경변수 누락
     results.append(("필수 환경변수 누락 처리", test_env_missing_fields()))
 
-    # 결과 요약
-    logger.info("\n" + "=" * 80)
-    logger.info("📊 테스트 결과 요약")
-    logger.info("=" * 80)
-
+    # 결과 요약 (한 번에 로깅)
     passed = sum(1 for _, result in results if result)
     total = len(results)
 
+    lines = [f"\n{_DIVIDER}", "📊 테스트 결과 요약", _DIVIDER]
     for test_name, result in results:
         status = "✅ PASS" if result else "❌ FAIL"
-        logger.info(f"   {status} | {test_name}")
+        lines.append(f"   {status} | {test_name}")
+    lines.append(f"\n{_DIVIDER}")
+    logger.info("\n".join(lines))
 
-    logger.info("\n" + "=" * 80)
     if passed == total:
-        logger.info(f"✅ 모든 테스트 통과! ({passed}/{total})")
+        logger.info(f"✅ 모든 테스트 통과! ({passed}/{total})\n{_DIVIDER}")
     else:
-        logger.error(f"❌ 일부 테스트 실패 ({passed}/{total})")
-    logger.info("=" * 80)
+        logger.error(f"❌ 일부 테스트 실패 ({passed}/{total})\n{_DIVIDER}")
 
 
 if __name__ == "__main__":
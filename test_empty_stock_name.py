@@ -5,6 +5,13 @@ import re
 import sys
 sys.path.append('/home/ralph/work/python/stock_tel')
 
+# 파싱 정규식 (모듈 로드 시 1회 컴파일)
+# 종목명이 비어있어도 종목코드만 있으면 매수 가능하도록 0개 이상 허용
+# 종목명은 '단어(공백 단어)*' 형태로만 매칭해 공백 구간에서 역추적이 폭증하지 않도록 함
+_STOCK_RE = re.compile(r'(?:포착\s*)?종목명\s*[:：]\s*([가-힣a-zA-Z0-9＆&]*(?:\s+[가-힣a-zA-Z0-9＆&]+)*)\s*\((\d{6})\)')
+_TARGET_RE = re.compile(r'적정\s*매수가?\s*[:：]\s*([\d,]+)원?')
+_CURRENT_RE = re.compile(r'(?:포착\s*)?현재가\s*[:：]\s*([\d,]+)원?')
+
 
 def parse_stock_signal(message_text: str) -> dict:
     """
@@ -16,9 +23,7 @@ def parse_stock_signal(message_text: str) -> dict:
             return None
 
         # 종목명과 종목코드 추출
-        # 종목명이 비어있어도 종목코드만 있으면 매수 가능하도록 *? 사용 (0개 이상)
-        stock_pattern = r'(?:포착\s*)?종목명\s*[:：]\s*([가-힣a-zA-Z0-9＆&\s]*?)\s*\((\d{6})\)'
-        stock_match = re.search(stock_pattern, message_text)
+        stock_match = _STOCK_RE.search(message_text)
 
         if not stock_match:
             print("⚠️ 종목명/종목코드를 찾을 수 없습니다")
@@ -34,15 +39,13 @@ def parse_stock_signal(message_text: str) -> dict:
 
         # 적정 매수가 추출 (선택)
         target_price = None
-        target_pattern = r'적정\s*매수가?\s*[:：]\s*([\d,]+)원?'
-        target_match = re.search(target_pattern, message_text)
+        target_match = _TARGET_RE.search(message_text)
         if target_match:
             target_price = int(target_match.group(1).replace(',', ''))
 
         # 현재가 추출 (선택)
         current_price = None
-        current_pattern = r'(?:포착\s*)?현재가\s*[:：]\s*([\d,]+)원?'
-        current_match = re.search(current_pattern, message_text)
+        current_match = _CURRENT_RE.search(message_text)
         if current_match:
             current_price = int(current_match.group(1).replace(',', ''))
 
@@ -9,11 +9,95 @@ import os
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from kiwoom_order import get_tick_size, parse_price_string
+from kiwoom_order import get_tick_size, get_tick_sizes, parse_price_string
 from order_executor import OrderExecutor
 from trading_system_base import TradingSystemBase
 from config import TradingConfig
 from datetime import datetime, time
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _get_executor() -> OrderExecutor:
+    """계산 메서드 테스트용 OrderExecutor (API 없이 1회 생성하여 공유)"""
+    return OrderExecutor(None, "12345678-01")
+
+
+# 테스트 케이스 테이블 (케이스별로 독립 실행되며, 다른 러너에서도 재사용 가능)
+
+TICK_SIZE_CASES = [
+    # (입력값, 예상 결과, 설명)
+    (0, 1, "0원 → 최소 틱 1원"),
+    (-100, 1, "음수 가격 → 최소 틱 1원"),
+    (999, 1, "경계값: 999원 → 1원"),
+    (1000, 5, "경계값: 1,000원 → 5원"),
+    (4999, 5, "경계값: 4,999원 → 5원"),
+    (5000, 10, "경계값: 5,000원 → 10원"),
+    (9999, 10, "경계값: 9,999원 → 10원"),
+    (10000, 50, "경계값: 10,000원 → 50원"),
+    (49999, 50, "경계값: 49,999원 → 50원"),
+    (50000, 100, "경계값: 50,000원 → 100원"),
+    (99999, 100, "경계값: 99,999원 → 100원"),
+    (100000, 500, "경계값: 100,000원 → 500원"),
+    (499999, 500, "경계값: 499,999원 → 500원"),
+    (500000, 1000, "경계값: 500,000원 → 1,000원"),
+    (1000000, 1000, "경계값: 1,000,000원 → 1,000원"),
+]
+
+
+PARSE_PRICE_CASES = [
+    # (입력값, 예상 결과, 설명)
+    ("10,000원", 10000, "정상: 쉼표 포함 문자열"),
+    ("10000원", 10000, "정상: 쉼표 없는 문자열"),
+    ("10,000", 10000, "정상: 원 기호 없음"),
+    ("10000", 10000, "정상: 숫자만"),
+    ("", 0, "빈 문자열 → 0"),
+    ("0원", 0, "0원"),
+    ("-1000원", 0, "음수 → 0 (최소값 보정)"),
+    ("+75,000", 75000, "부호(+) 포함 가격 → 부호 제거"),
+    ("-75,000", 0, "부호(-) 포함 가격 → 0 (음수와 동일)"),
+    ("abc", 0, "잘못된 문자열 → 0"),
+    ("1,2,3,4", 1234, "여러 쉼표"),
+    ("   1000   ", 1000, "공백 포함"),
+]
+
+
+BUY_QUANTITY_CASES = [
+    # (투자금, 가격, 예상 수량, 설명)
+    (1000000, 0, 0, "0원 주식 → 0주 (예외 처리)"),
+    (1000000, -100, 0, "음수 가격 → 0주 (예외 처리)"),
+    (0, 10000, 0, "0원 투자 → 0주"),
+    (-100000, 10000, 0, "음수 투자 → 0주 (예외 처리)"),
+    (100, 10000, 0, "투자금 < 주가 → 0주"),
+    (10000, 10000, 0, "투자금 = 주가 (2% 마진 적용) → 0주"),
+    (10300, 10000, 1, "최소 1주 매수 가능"),
+    (1000000, 1000000, 0, "초고가 주식 → 0주"),
+]
+
+
+DUPLICATE_ORDER_CASES = [
+    # (order_executed, sell_executed, 예상 매수 가능, 예상 매도 가능, 설명)
+    (False, False, True, True, "초기 상태: 매수/매도 모두 가능"),
+    (True, False, False, True, "매수 완료: 매도만 가능"),
+    (False, True, True, False, "매도 완료: 매수만 가능 (비정상 상태)"),
+    (True, True, False, False, "매수/매도 모두 완료: 둘 다 불가"),
+]
+
+
+# 매수 가능 시간: 08:50 ~ 12:10
+_BUY_START, _BUY_END = time(8, 50), time(12, 10)
+
+TIME_BOUNDARY_CASES = [
+    # (시간, 예상 매수 가능 여부, 설명)
+    (time(8, 49), False, "매수 시작 1분 전 → 불가"),
+    (time(8, 50), True, "매수 시작 시간 정각 → 가능"),
+    (time(8, 51), True, "매수 시작 1분 후 → 가능"),
+    (time(12, 9), True, "매수 종료 1분 전 → 가능"),
+    (time(12, 10), False, "매수 종료 시간 정각 → 불가"),
+    (time(12, 11), False, "매수 종료 1분 후 → 불가"),
+    (time(0, 0), False, "자정 → 불가"),
+    (time(23, 59), False, "하루 끝 → 불가"),
+]
 
 
 def test_price_edge_cases():
@@ -22,28 +106,17 @@ def test_price_edge_cases():
     print("8-1. 가격 엣지 케이스 테스트")
     print("=" * 80)
 
-    test_cases = [
-        # (입력값, 예상 결과, 설명)
-        (0, 1, "0원 → 최소 틱 1원"),
-        (-100, 1, "음수 가격 → 최소 틱 1원"),
-        (999, 1, "경계값: 999원 → 1원"),
-        (1000, 5, "경계값: 1,000원 → 5원"),
-        (4999, 5, "경계값: 4,999원 → 5원"),
-        (5000, 10, "경계값: 5,000원 → 10원"),
-        (9999, 10, "경계값: 9,999원 → 10원"),
-        (10000, 50, "경계값: 10,000원 → 50원"),
-        (49999, 50, "경계값: 49,999원 → 50원"),
-        (50000, 100, "경계값: 50,000원 → 100원"),
-        (99999, 100, "경계값: 99,999원 → 100원"),
-        (100000, 500, "경계값: 100,000원 → 500원"),
-        (499999, 500, "경계값: 499,999원 → 500원"),
-        (500000, 1000, "경계값: 500,000원 → 1,000원"),
-        (1000000, 1000, "경계값: 1,000,000원 → 1,000원"),
-    ]
-
     all_passed = True
-    for price, expected_tick, description in test_cases:
-        result = get_tick_size(price)
+    for price, expected_tick, description in TICK_SIZE_CASES:
+        try:
+            result = get_tick_size(price)
+        except Exception as e:
+            # 한 케이스의 예외가 나머지 케이스 실행을 막지 않도록 처리
+            all_passed = False
+            print(f"❌ {description}")
+            print(f"   입력: {price:,}원, 예외 발생: {str(e)}")
+            continue
+
         status = "✅" if result == expected_tick else "❌"
 
         if result != expected_tick:
@@ -53,6 +126,29 @@ def test_price_edge_cases():
         else:
             print(f"{status} {description}")
 
+    # 일괄 계산 경로도 단건 계산과 같은 결과인지 확인
+    prices = [price for price, _, _ in TICK_SIZE_CASES]
+    expected_ticks = [expected_tick for _, expected_tick, _ in TICK_SIZE_CASES]
+    batch_result = get_tick_sizes(prices)
+    if batch_result == expected_ticks:
+        print("✅ get_tick_sizes 일괄 계산 결과 일치")
+    else:
+        all_passed = False
+        print("❌ get_tick_sizes 일괄 계산 결과 불일치")
+        print(f"   예상: {expected_ticks}")
+        print(f"   실제: {batch_result}")
+
+    # 같은 가격 반복 조회 시 캐시 적중 확인
+    hits_before = get_tick_size.cache_info().hits
+    for _ in range(100):
+        get_tick_size(12345)
+    cache_hits = get_tick_size.cache_info().hits - hits_before
+    if cache_hits >= 99:
+        print(f"✅ get_tick_size 캐시 적중: {cache_hits}회")
+    else:
+        all_passed = False
+        print(f"❌ get_tick_size 캐시 적중 부족: {cache_hits}회 (예상: 99회 이상)")
+
     if all_passed:
         print("\n✅ 모든 가격 엣지 케이스 테스트 통과!")
     else:
@@ -67,22 +163,8 @@ def test_parse_price_edge_cases():
     print("8-2. 가격 파싱 엣지 케이스 테스트")
     print("=" * 80)
 
-    test_cases = [
-        # (입력값, 예상 결과, 설명)
-        ("10,000원", 10000, "정상: 쉼표 포함 문자열"),
-        ("10000원", 10000, "정상: 쉼표 없는 문자열"),
-        ("10,000", 10000, "정상: 원 기호 없음"),
-        ("10000", 10000, "정상: 숫자만"),
-        ("", 0, "빈 문자열 → 0"),
-        ("0원", 0, "0원"),
-        ("-1000원", 0, "음수 → 0 (최소값 보정)"),
-        ("abc", 0, "잘못된 문자열 → 0"),
-        ("1,2,3,4", 1234, "여러 쉼표"),
-        ("   1000   ", 1000, "공백 포함"),
-    ]
-
     all_passed = True
-    for price_str, expected, description in test_cases:
+    for price_str, expected, description in PARSE_PRICE_CASES:
         try:
             result = parse_price_string(price_str)
             status = "✅" if result == expected else "❌"
@@ -112,22 +194,10 @@ def test_buy_quantity_edge_cases():
     print("8-3. 매수 수량 계산 엣지 케이스 테스트")
     print("=" * 80)
 
-    executor = OrderExecutor(None, "12345678-01")  # Mock
-
-    test_cases = [
-        # (투자금, 가격, 예상 수량, 설명)
-        (1000000, 0, 0, "0원 주식 → 0주 (예외 처리)"),
-        (1000000, -100, 0, "음수 가격 → 0주 (예외 처리)"),
-        (0, 10000, 0, "0원 투자 → 0주"),
-        (-100000, 10000, 0, "음수 투자 → 0주 (예외 처리)"),
-        (100, 10000, 0, "투자금 < 주가 → 0주"),
-        (10000, 10000, 0, "투자금 = 주가 (2% 마진 적용) → 0주"),
-        (10300, 10000, 1, "최소 1주 매수 가능"),
-        (1000000, 1000000, 0, "초고가 주식 → 0주"),
-    ]
+    executor = _get_executor()
 
     all_passed = True
-    for investment, price, expected, description in test_cases:
+    for investment, price, expected, description in BUY_QUANTITY_CASES:
         try:
             result = executor.calculate_buy_quantity(price, investment)
             status = "✅" if result == expected else "❌"
@@ -163,16 +233,8 @@ def test_duplicate_order_prevention():
     print("=" * 80)
 
     # TradingSystemBase의 플래그 상태 시뮬레이션
-    test_cases = [
-        # (order_executed, sell_executed, 예상 매수 가능, 예상 매도 가능, 설명)
-        (False, False, True, True, "초기 상태: 매수/매도 모두 가능"),
-        (True, False, False, True, "매수 완료: 매도만 가능"),
-        (False, True, True, False, "매도 완료: 매수만 가능 (비정상 상태)"),
-        (True, True, False, False, "매수/매도 모두 완료: 둘 다 불가"),
-    ]
-
     all_passed = True
-    for order_exec, sell_exec, can_buy, can_sell, description in test_cases:
+    for order_exec, sell_exec, can_buy, can_sell, description in DUPLICATE_ORDER_CASES:
         # 매수 가능 여부
         buy_possible = not order_exec
         # 매도 가능 여부
@@ -202,26 +264,10 @@ def test_time_boundary_cases():
     print("8-5. 시간 경계값 테스트")
     print("=" * 80)
 
-    # 매수 가능 시간: 08:50 ~ 12:10
-    buy_start = time(8, 50)
-    buy_end = time(12, 10)
-
-    test_cases = [
-        # (시간, 예상 매수 가능 여부, 설명)
-        (time(8, 49), False, "매수 시작 1분 전 → 불가"),
-        (time(8, 50), True, "매수 시작 시간 정각 → 가능"),
-        (time(8, 51), True, "매수 시작 1분 후 → 가능"),
-        (time(12, 9), True, "매수 종료 1분 전 → 가능"),
-        (time(12, 10), False, "매수 종료 시간 정각 → 불가"),
-        (time(12, 11), False, "매수 종료 1분 후 → 불가"),
-        (time(0, 0), False, "자정 → 불가"),
-        (time(23, 59), False, "하루 끝 → 불가"),
-    ]
-
     all_passed = True
-    for current_time, expected, description in test_cases:
+    for current_time, expected, description in TIME_BOUNDARY_CASES:
         # 매수 가능 시간 체크 로직
-        is_buy_time = buy_start <= current_time < buy_end
+        is_buy_time = _BUY_START <= current_time < _BUY_END
 
         status = "✅" if is_buy_time == expected else "❌"
 
@@ -10,9 +10,14 @@
 """
 
 import asyncio
+import dataclasses
 import logging
+import traceback
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime, timedelta
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock
+import trading_system_base
 from config import TradingConfig
 from trading_system_base import TradingSystemBase
 
@@ -23,6 +28,92 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 시뮬레이션 기준 시각 (2025-01-14, "HH:MM" → datetime)
+TEST_TIMES = {
+    "14:00": datetime(2025, 1, 14, 14, 0),
+    "15:18": datetime(2025, 1, 14, 15, 18),
+    "15:19": datetime(2025, 1, 14, 15, 19),
+    "15:20": datetime(2025, 1, 14, 15, 20),
+    "15:30": datetime(2025, 1, 14, 15, 30),
+}
+
+
+@lru_cache(maxsize=1)
+def _base_config() -> TradingConfig:
+    """환경변수에서 Config를 1회만 로드하여 테스트 간 공유"""
+    return TradingConfig.from_env()
+
+
+def force_sell_config(**overrides) -> TradingConfig:
+    """공유 Config 복사본에 강제 청산(15:19)을 켜고 overrides를 적용"""
+    return dataclasses.replace(
+        _base_config(),
+        enable_daily_force_sell=True,
+        daily_force_sell_time="15:19",
+        **overrides
+    )
+
+
+@contextmanager
+def frozen_now(mock_time: datetime):
+    """
+    trading_system_base.datetime.now()가 mock_time을 반환하도록 고정
+
+    patch()의 MagicMock 대신 now()/strptime만 가진 작은 클래스로
+    모듈 속성을 직접 바꿔 끼우고, 블록을 벗어나면 원래대로 복원합니다.
+    """
+    class _FrozenDateTime:
+        now = staticmethod(lambda: mock_time)
+        strptime = staticmethod(datetime.strptime)  # strptime은 실제 함수 사용
+
+    original = trading_system_base.datetime
+    trading_system_base.datetime = _FrozenDateTime
+    try:
+        yield
+    finally:
+        trading_system_base.datetime = original
+
+
+def make_buy_info() -> dict:
+    """
+    시뮬레이션 기준 시각(14:00) 10분 전 10,000원에 100주 매수한 테스트종목(000000) 매수 정보
+
+    TradingSystemBase가 buy_info를 dict로 읽고 갱신(get/pop/항목 대입)하므로
+    실제와 같은 dict 형태로 만들어 테스트마다 새로 넘겨줍니다.
+    매수 시간은 실제 시계가 아닌 고정 시각(TEST_TIMES) 기준이라 frozen_now와 어긋나지 않습니다.
+    """
+    return {
+        "stock_code": "000000",
+        "stock_name": "테스트종목",
+        "buy_price": 10000,
+        "quantity": 100,
+        "buy_time": TEST_TIMES["14:00"] - timedelta(minutes=10),
+        "target_profit_rate": 0.01
+    }
+
+
+def async_recorder():
+    """
+    호출 인자만 기록하는 가벼운 async 함수 (AsyncMock 대체)
+
+    호출 내역은 .calls 리스트에 (args, kwargs) 튜플로 쌓이며,
+    호출 여부는 .calls가 비어 있는지로 확인합니다.
+    """
+    calls = []
+
+    async def recorder(*args, **kwargs):
+        calls.append((args, kwargs))
+
+    recorder.calls = calls
+    return recorder
+
+
+def reset_scenario(system) -> None:
+    """시나리오 사이에 매도 호출 기록과 sell_executed 플래그만 초기화 (recorder는 재사용)"""
+    for recorder in (system.execute_daily_force_sell, system.execute_stop_loss, system.execute_auto_sell):
+        recorder.calls.clear()
+    system.sell_executed = False
+
 
 class MockTradingSystem(TradingSystemBase):
     """테스트용 TradingSystemBase Mock 클래스"""
@@ -32,50 +123,46 @@ class MockTradingSystem(TradingSystemBase):
         pass
 
 
-async def test_force_sell_time_detection():
+def test_force_sell_time_detection():
     """강제 청산 시간 감지 테스트"""
     logger.info("=" * 80)
     logger.info("🧪 테스트 1: 강제 청산 시간 감지")
     logger.info("=" * 80)
 
     # Config 생성 (강제 청산 활성화)
-    config = TradingConfig.from_env()
-    config.enable_daily_force_sell = True
-    config.daily_force_sell_time = "15:19"
+    config = force_sell_config()
 
     # Mock 시스템 생성
     system = MockTradingSystem(config)
 
     # 현재 시간 확인
     now = datetime.now()
-    current_time_str = now.strftime("%H:%M")
+    current_time_str = f"{now.hour:02d}:{now.minute:02d}"
 
-    logger.info(f"✅ 현재 시간: {current_time_str}")
-    logger.info(f"✅ 강제 청산 설정 시간: {config.daily_force_sell_time}")
-    logger.info(f"✅ 강제 청산 활성화 여부: {config.enable_daily_force_sell}")
+    logger.info("✅ 현재 시간: %s", current_time_str)
+    logger.info("✅ 강제 청산 설정 시간: %s", config.daily_force_sell_time)
+    logger.info("✅ 강제 청산 활성화 여부: %s", config.enable_daily_force_sell)
 
     # is_force_sell_time() 메서드 테스트
     is_time = system.is_force_sell_time()
 
     if is_time:
-        logger.info(f"🎯 강제 청산 시간 도달! (현재: {current_time_str} >= 설정: {config.daily_force_sell_time})")
+        logger.info("🎯 강제 청산 시간 도달! (현재: %s >= 설정: %s)", current_time_str, config.daily_force_sell_time)
     else:
-        logger.info(f"⏰ 강제 청산 시간 미도달 (현재: {current_time_str} < 설정: {config.daily_force_sell_time})")
+        logger.info("⏰ 강제 청산 시간 미도달 (현재: %s < 설정: %s)", current_time_str, config.daily_force_sell_time)
 
     logger.info("")
     return is_time
 
 
-async def test_force_sell_time_with_mocking():
+def test_force_sell_time_with_mocking():
     """시간 Mocking을 통한 강제 청산 시간 테스트"""
     logger.info("=" * 80)
     logger.info("🧪 테스트 2: 강제 청산 시간 Mocking 테스트")
     logger.info("=" * 80)
 
     # Config 생성
-    config = TradingConfig.from_env()
-    config.enable_daily_force_sell = True
-    config.daily_force_sell_time = "15:19"
+    config = force_sell_config()
 
     # Mock 시스템 생성
     system = MockTradingSystem(config)
@@ -90,16 +177,11 @@ async def test_force_sell_time_with_mocking():
 
     for test_time, expected, description in test_cases:
         # datetime.now() Mock
-        mock_time = datetime.strptime(f"2025-01-14 {test_time}", "%Y-%m-%d %H:%M")
-
-        with patch('trading_system_base.datetime') as mock_datetime:
-            mock_datetime.now.return_value = mock_time
-            mock_datetime.strptime = datetime.strptime  # strptime은 실제 함수 사용
-
+        with frozen_now(TEST_TIMES[test_time]):
             is_time = system.is_force_sell_time()
 
             status = "✅ PASS" if is_time == expected else "❌ FAIL"
-            logger.info(f"{status} | 시간: {test_time} | 예상: {expected} | 실제: {is_time} | {description}")
+            logger.info("%s | 시간: %s | 예상: %s | 실제: %s | %s", status, test_time, expected, is_time, description)
 
     logger.info("")
 
@@ -111,61 +193,48 @@ async def test_force_sell_priority():
     logger.info("=" * 80)
 
     # Config 생성
-    config = TradingConfig.from_env()
-    config.enable_daily_force_sell = True
-    config.daily_force_sell_time = "15:19"
-    config.enable_stop_loss = True
-    config.stop_loss_rate = -0.025  # -2.5%
-    config.target_profit_rate = 0.01  # 1%
+    config = force_sell_config(
+        enable_stop_loss=True,
+        stop_loss_rate=-0.025,  # -2.5%
+        target_profit_rate=0.01  # 1%
+    )
 
     # Mock 시스템 생성
     system = MockTradingSystem(config)
 
     # 매수 정보 설정
-    system.buy_info = {
-        "stock_code": "000000",
-        "stock_name": "테스트종목",
-        "buy_price": 10000,
-        "quantity": 100,
-        "buy_time": datetime.now() - timedelta(minutes=10),
-        "target_profit_rate": 0.01
-    }
+    system.buy_info = make_buy_info()
 
     # Mock 함수 설정
-    system.execute_daily_force_sell = AsyncMock()
-    system.execute_stop_loss = AsyncMock()
-    system.execute_auto_sell = AsyncMock()
+    system.execute_daily_force_sell = async_recorder()
+    system.execute_stop_loss = async_recorder()
+    system.execute_auto_sell = async_recorder()
 
     # 시나리오 1: 강제청산 시간 + 익절 조건 + 손절 조건 모두 만족
     logger.info("📋 시나리오 1: 강제청산 시간 + 익절 조건 + 손절 조건 모두 만족")
 
     # 강제 청산 시간으로 Mock
-    mock_time = datetime.strptime("2025-01-14 15:19", "%Y-%m-%d %H:%M")
-
-    with patch('trading_system_base.datetime') as mock_datetime:
-        mock_datetime.now.return_value = mock_time
-        mock_datetime.strptime = datetime.strptime
-
+    with frozen_now(TEST_TIMES["15:19"]):
         # 익절 조건 만족하는 가격 (10,100원 = +1%)
         current_price = 10100
         profit_rate = (current_price - system.buy_info["buy_price"]) / system.buy_info["buy_price"]
 
-        logger.info(f"   현재가: {current_price:,}원")
-        logger.info(f"   수익률: {profit_rate*100:.2f}%")
-        logger.info(f"   강제청산 시간: {system.is_force_sell_time()}")
-        logger.info(f"   익절 조건: {profit_rate >= config.target_profit_rate}")
-        logger.info(f"   손절 조건: {profit_rate <= config.stop_loss_rate}")
+        logger.info("   현재가: %s원", format(current_price, ","))
+        logger.info("   수익률: %.2f%%", profit_rate * 100)
+        logger.info("   강제청산 시간: %s", system.is_force_sell_time())
+        logger.info("   익절 조건: %s", profit_rate >= config.target_profit_rate)
+        logger.info("   손절 조건: %s", profit_rate <= config.stop_loss_rate)
 
         # on_price_update 호출
         await system.on_price_update("000000", current_price, {})
 
         # 검증
-        if system.execute_daily_force_sell.called:
+        if system.execute_daily_force_sell.calls:
             logger.info("   ✅ 강제 청산이 최우선으로 실행됨")
         else:
             logger.error("   ❌ 강제 청산이 실행되지 않음")
 
-        if not system.execute_auto_sell.called and not system.execute_stop_loss.called:
+        if not system.execute_auto_sell.calls and not system.execute_stop_loss.calls:
             logger.info("   ✅ 익절/손절이 실행되지 않음 (올바른 우선순위)")
         else:
             logger.error("   ❌ 익절/손절이 실행됨 (잘못된 우선순위)")
@@ -173,45 +242,37 @@ async def test_force_sell_priority():
     logger.info("")
 
     # 초기화
-    system.execute_daily_force_sell.reset_mock()
-    system.execute_stop_loss.reset_mock()
-    system.execute_auto_sell.reset_mock()
-    system.sell_executed = False
+    reset_scenario(system)
 
     # 시나리오 2: 강제청산 시간 아님 + 손절 조건 + 익절 조건 만족
     logger.info("📋 시나리오 2: 강제청산 시간 아님 + 손절 조건 + 익절 조건 만족")
 
-    mock_time = datetime.strptime("2025-01-14 14:00", "%Y-%m-%d %H:%M")
-
-    with patch('trading_system_base.datetime') as mock_datetime:
-        mock_datetime.now.return_value = mock_time
-        mock_datetime.strptime = datetime.strptime
-
+    with frozen_now(TEST_TIMES["14:00"]):
         # 손절 조건 만족하는 가격 (9,700원 = -3%)
         current_price = 9700
         profit_rate = (current_price - system.buy_info["buy_price"]) / system.buy_info["buy_price"]
 
-        logger.info(f"   현재가: {current_price:,}원")
-        logger.info(f"   수익률: {profit_rate*100:.2f}%")
-        logger.info(f"   강제청산 시간: {system.is_force_sell_time()}")
-        logger.info(f"   익절 조건: {profit_rate >= config.target_profit_rate}")
-        logger.info(f"   손절 조건: {profit_rate <= config.stop_loss_rate}")
+        logger.info("   현재가: %s원", format(current_price, ","))
+        logger.info("   수익률: %.2f%%", profit_rate * 100)
+        logger.info("   강제청산 시간: %s", system.is_force_sell_time())
+        logger.info("   익절 조건: %s", profit_rate >= config.target_profit_rate)
+        logger.info("   손절 조건: %s", profit_rate <= config.stop_loss_rate)
 
         # on_price_update 호출
         await system.on_price_update("000000", current_price, {})
 
         # 검증
-        if not system.execute_daily_force_sell.called:
+        if not system.execute_daily_force_sell.calls:
             logger.info("   ✅ 강제 청산이 실행되지 않음 (시간 미도달)")
         else:
             logger.error("   ❌ 강제 청산이 실행됨 (시간 미도달인데 실행)")
 
-        if system.execute_stop_loss.called:
+        if system.execute_stop_loss.calls:
             logger.info("   ✅ 손절이 실행됨 (강제청산 다음 우선순위)")
         else:
             logger.error("   ❌ 손절이 실행되지 않음")
 
-        if not system.execute_auto_sell.called:
+        if not system.execute_auto_sell.calls:
             logger.info("   ✅ 익절이 실행되지 않음 (손절 우선)")
         else:
             logger.error("   ❌ 익절이 실행됨 (손절보다 우선 실행됨)")
@@ -226,22 +287,13 @@ async def test_force_sell_execution_logic():
     logger.info("=" * 80)
 
     # Config 생성
-    config = TradingConfig.from_env()
-    config.enable_daily_force_sell = True
-    config.daily_force_sell_time = "15:19"
+    config = force_sell_config()
 
     # Mock 시스템 생성
     system = MockTradingSystem(config)
 
     # 매수 정보 설정
-    system.buy_info = {
-        "stock_code": "000000",
-        "stock_name": "테스트종목",
-        "buy_price": 10000,
-        "quantity": 100,
-        "buy_time": datetime.now() - timedelta(minutes=10),
-        "target_profit_rate": 0.01
-    }
+    system.buy_info = make_buy_info()
 
     # kiwoom_api Mock
     system.kiwoom_api = Mock()
@@ -260,18 +312,18 @@ async def test_force_sell_execution_logic():
 
     # WebSocket Mock
     system.websocket = Mock()
-    system.websocket.unregister_stock = AsyncMock()
+    system.websocket.unregister_stock = async_recorder()
     system.ws_receive_task = Mock()
     system.ws_receive_task.cancel = Mock()
 
     # save_force_sell_result Mock
-    system.save_force_sell_result = AsyncMock()
+    system.save_force_sell_result = async_recorder()
 
     logger.info("📊 초기 상태:")
-    logger.info(f"   종목코드: {system.buy_info['stock_code']}")
-    logger.info(f"   종목명: {system.buy_info['stock_name']}")
-    logger.info(f"   매수가: {system.buy_info['buy_price']:,}원")
-    logger.info(f"   보유 수량: {system.buy_info['quantity']}주")
+    logger.info("   종목코드: %s", system.buy_info["stock_code"])
+    logger.info("   종목명: %s", system.buy_info["stock_name"])
+    logger.info("   매수가: %s원", format(system.buy_info["buy_price"], ","))
+    logger.info("   보유 수량: %s주", system.buy_info["quantity"])
     logger.info("")
 
     # 강제 청산 실행
@@ -290,18 +342,18 @@ async def test_force_sell_execution_logic():
     if system.kiwoom_api.place_market_sell_order.called:
         logger.info("   ✅ 시장가 매도 주문 호출됨")
         call_args = system.kiwoom_api.place_market_sell_order.call_args
-        logger.info(f"      - 종목코드: {call_args.kwargs.get('stock_code')}")
-        logger.info(f"      - 수량: {call_args.kwargs.get('quantity')}주")
-        logger.info(f"      - 계좌번호: {call_args.kwargs.get('account_no')}")
+        logger.info("      - 종목코드: %s", call_args.kwargs.get("stock_code"))
+        logger.info("      - 수량: %s주", call_args.kwargs.get("quantity"))
+        logger.info("      - 계좌번호: %s", call_args.kwargs.get("account_no"))
     else:
         logger.error("   ❌ 시장가 매도 주문 호출 안됨")
 
-    if system.websocket.unregister_stock.called:
+    if system.websocket.unregister_stock.calls:
         logger.info("   ✅ WebSocket 시세 등록 해제됨")
     else:
         logger.error("   ❌ WebSocket 시세 등록 해제 안됨")
 
-    if system.save_force_sell_result.called:
+    if system.save_force_sell_result.calls:
         logger.info("   ✅ 강제 청산 결과 저장됨")
     else:
         logger.error("   ❌ 강제 청산 결과 저장 안됨")
@@ -318,10 +370,10 @@ async def main():
 
     try:
         # 테스트 1: 실제 시간 기반 강제 청산 시간 감지
-        await test_force_sell_time_detection()
+        test_force_sell_time_detection()
 
         # 테스트 2: Mocking을 통한 강제 청산 시간 테스트
-        await test_force_sell_time_with_mocking()
+        test_force_sell_time_with_mocking()
 
         # 테스트 3: 강제 청산 우선순위 검증
         await test_force_sell_priority()
@@ -334,8 +386,7 @@ async def main():
         logger.info("=" * 80)
 
     except Exception as e:
-        logger.error(f"❌ 테스트 중 오류 발생: {e}")
-        import traceback
+        logger.error("❌ 테스트 중 오류 발생: %s", e)
         traceback.print_exc()
 
 
@@ -2,10 +2,12 @@
 지정가 매수 시 매수 수량 계산 로직 검증
 - 현재가 기준 수량으로 지정가 주문 시 금액 초과 여부 확인
 """
+import io
 import sys
+from contextlib import redirect_stdout
 sys.path.append('/home/ralph/work/python/stock_tel')
 
-from kiwoom_order import get_tick_size
+from kiwoom_order import get_tick_sizes
 
 
 def calculate_buy_quantity(current_price: int, max_investment: int, safety_margin: float = 0.02) -> int:
@@ -30,6 +32,36 @@ def calculate_buy_quantity(current_price: int, max_investment: int, safety_margi
     return quantity
 
 
+def evaluate_cases(cases: list, safety_margin: float = 0.02) -> list:
+    """
+    테스트 케이스 전체의 수량/지정가를 한 번에 계산
+
+    틱 크기는 get_tick_sizes()로 일괄 조회하고, 나머지 값도 케이스별
+    출력 루프에 들어가기 전에 미리 계산해 둡니다.
+
+    Args:
+        cases: (최대 투자금액, 현재가, 설명) 튜플 리스트
+        safety_margin: 안전 마진 (기본 2%)
+
+    Returns:
+        list: (최대 투자금액, 현재가, 설명, 조정 투자금액, 수량, 틱 크기, 지정가) 튜플 리스트
+    """
+    tick_sizes = get_tick_sizes([current_price for _, current_price, _ in cases])
+
+    return [
+        (
+            max_investment,
+            current_price,
+            description,
+            int(max_investment * (1 - safety_margin)),
+            calculate_buy_quantity(current_price, max_investment, safety_margin),
+            tick_size,
+            current_price + tick_size,
+        )
+        for (max_investment, current_price, description), tick_size in zip(cases, tick_sizes)
+    ]
+
+
 def test_limit_buy_quantity():
     """지정가 매수 시 수량 계산 테스트"""
     print("\n" + "=" * 80)
@@ -49,22 +81,16 @@ def test_limit_buy_quantity():
 
     issues_found = []
 
-    for max_investment, current_price, description in test_cases:
+    # 안전 마진 2% 적용, 수량은 현재가 기준(현재 로직), 지정가는 현재가 + 1틱
+    safety_margin = 0.02
+    evaluated = evaluate_cases(test_cases, safety_margin)
+
+    for (max_investment, current_price, description,
+         adjusted_investment, quantity, tick_size, order_price) in evaluated:
         print(f"\n" + "-" * 80)
         print(f"📊 {description}")
         print("-" * 80)
 
-        # 안전 마진 2% 적용
-        safety_margin = 0.02
-        adjusted_investment = int(max_investment * (1 - safety_margin))
-
-        # 현재가 기준 수량 계산 (현재 로직)
-        quantity = calculate_buy_quantity(current_price, max_investment, safety_margin)
-
-        # 지정가 계산 (현재가 + 1틱)
-        tick_size = get_tick_size(current_price)
-        order_price = current_price + tick_size
-
         # 현재가 기준 필요 금액
         required_amount_current = current_price * quantity
 
@@ -173,18 +199,12 @@ def test_extreme_cases():
         (1000000, 1000000, "극단: 초고가 주식"),
     ]
 
-    for max_investment, current_price, description in extreme_cases:
+    for (max_investment, current_price, description,
+         _, quantity, tick_size, order_price) in evaluate_cases(extreme_cases):
         print(f"\n" + "-" * 80)
         print(f"📊 {description}")
         print("-" * 80)
 
-        safety_margin = 0.02
-        adjusted_investment = int(max_investment * (1 - safety_margin))
-
-        quantity = calculate_buy_quantity(current_price, max_investment, safety_margin)
-        tick_size = get_tick_size(current_price)
-        order_price = current_price + tick_size
-
         required_amount_limit = order_price * quantity
 
         print(f"   현재가: {current_price:,}원")
@@ -202,11 +222,17 @@ def test_extreme_cases():
 
 
 if __name__ == "__main__":
-    # 일반 케이스 테스트
-    result = test_limit_buy_quantity()
-
-    # 극단적인 케이스 테스트
-    test_extreme_cases()
+    # 케이스별 print를 메모리에 모았다가 마지막에 한 번에 출력
+    out = io.StringIO()
+    try:
+        with redirect_stdout(out):
+            # 일반 케이스 테스트
+            result = test_limit_buy_quantity()
+
+            # 극단적인 케이스 테스트
+            test_extreme_cases()
+    finally:
+        sys.stdout.write(out.getvalue())
 
     # 종료 코드
     sys.exit(0 if result else 1)
@@ -3,36 +3,18 @@
 
 괄호 안 6자리 숫자 기반 시그널 인식 테스트
 """
+import io
 import sys
+from functools import lru_cache
 sys.path.append('/home/ralph/work/python/stock_tel')
 
 from config import TradingConfig
 from auto_trading import TelegramTradingSystem
 
 
-def test_case(title: str, message: str, expected: dict) -> bool:
-    """
-    개별 테스트 케이스 실행
-
-    Args:
-        title: 테스트 케이스 제목
-        message: 테스트할 메시지
-        expected: 기대값 딕셔너리
-
-    Returns:
-        True if all checks pass, False otherwise
-    """
-    print("\n" + "=" * 100)
-    print(f"📋 {title}")
-    print("=" * 100)
-    print("\n📨 테스트 메시지:")
-    lines = message.split('\n')
-    for line in lines[:7]:  # 처음 7줄만 출력
-        print(f"   {line}")
-    if len(lines) > 7:
-        print(f"   ... (총 {len(lines)}줄)")
-    print("\n" + "-" * 100)
-
+@lru_cache(maxsize=1)
+def _get_system() -> TelegramTradingSystem:
+    """파싱 테스트용 TelegramTradingSystem을 1회만 생성하여 테스트 케이스 간 공유"""
     # 설정 생성 (더미 - 최소한의 필수 파라미터만)
     config = TradingConfig(
         account_no="12345678-01",
@@ -66,47 +48,84 @@ def test_case(title: str, message: str, expected: dict) -> bool:
         target_channel="test"
     )
 
-    # 시스템 생성
-    system = TelegramTradingSystem(config)
+    return TelegramTradingSystem(config)
+
+
+def test_case(title: str, message: str, expected: dict) -> bool:
+    """
+    개별 테스트 케이스 실행
+
+    Args:
+        title: 테스트 케이스 제목
+        message: 테스트할 메시지
+        expected: 기대값 딕셔너리
+
+    Returns:
+        True if all checks pass, False otherwise
+    """
+    out = io.StringIO()
+
+    print("\n" + "=" * 100, file=out)
+    print(f"📋 {title}", file=out)
+    print("=" * 100, file=out)
+    print("\n📨 테스트 메시지:", file=out)
+    lines = message.split('\n')
+    for line in lines[:7]:  # 처음 7줄만 출력
+        print(f"   {line}", file=out)
+    if len(lines) > 7:
+        print(f"   ... (총 {len(lines)}줄)", file=out)
+    print("\n" + "-" * 100, file=out)
+
+    # 파싱 중 시스템 로그가 출력되므로 헤더를 먼저 내보냄
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
+    out = io.StringIO()
+
+    # 시스템 (모든 케이스가 공유)
+    system = _get_system()
 
     # 파싱 실행
     result = system.parse_stock_signal(message)
 
     if not result:
-        print("❌ 파싱 실패!")
+        print("❌ 파싱 실패!", file=out)
         if expected:
-            print(f"   기대값: {expected}")
-            return False
+            print(f"   기대값: {expected}", file=out)
         else:
-            print("   기대값도 None이므로 통과")
-            return True
+            print("   기대값도 None이므로 통과", file=out)
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+        return not expected
 
     # 결과 출력
-    print(f"\n📊 파싱 결과:")
-    print(f"   종목명: {result['stock_name']}")
-    print(f"   종목코드: {result['stock_code']}")
-    print(f"   적정매수가: {result['target_price']}")
-    print(f"   현재가: {result['current_price']}")
+    print(f"\n📊 파싱 결과:", file=out)
+    print(f"   종목명: {result['stock_name']}", file=out)
+    print(f"   종목코드: {result['stock_code']}", file=out)
+    print(f"   적정매수가: {result['target_price']}", file=out)
+    print(f"   현재가: {result['current_price']}", file=out)
 
     # 검증
-    print(f"\n🔎 검증:")
+    print(f"\n🔎 검증:", file=out)
     checks = []
 
     for key, expected_value in expected.items():
         actual_value = result.get(key)
         if actual_value == expected_value:
-            print(f"   ✅ {key}: {actual_value} (일치)")
+            print(f"   ✅ {key}: {actual_value} (일치)", file=out)
             checks.append(True)
         else:
-            print(f"   ❌ {key}: 예상 {expected_value}, 실제 {actual_value}")
+            print(f"   ❌ {key}: 예상 {expected_value}, 실제 {actual_value}", file=out)
             checks.append(False)
 
-    if all(checks):
-        print(f"\n✅ {title} 통과!")
-        return True
+    passed = all(checks)
+    if passed:
+        print(f"\n✅ {title} 통과!", file=out)
     else:
-        print(f"\n❌ {title} 실패!")
-        return False
+        print(f"\n❌ {title} 실패!", file=out)
+
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
+    return passed
 
 
 def main():
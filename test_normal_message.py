@@ -5,27 +5,51 @@ import re
 import sys
 sys.path.append('/home/ralph/work/python/stock_tel')
 
+# 파싱 정규식 (모듈 로드 시 1회 컴파일)
+# 종목/적정 매수가/현재가 패턴을 하나로 합쳐 메시지를 한 번만 훑고,
+# 어떤 항목이 매칭됐는지는 match.lastgroup(stock/target/current)으로 구분
+# 종목명이 비어있어도 종목코드만 있으면 매수 가능하도록 0개 이상 허용
+# 종목명은 '단어(공백 단어)*' 형태로만 매칭해 공백 구간에서 역추적이 폭증하지 않도록 함
+_SIGNAL_RE = re.compile(
+    r'(?P<stock>(?:포착\s*)?종목명\s*[:：]\s*(?P<name>[가-힣a-zA-Z0-9＆&]*(?:\s+[가-힣a-zA-Z0-9＆&]+)*)\s*\((?P<code>\d{6})\))'
+    r'|(?P<target>적정\s*매수가?\s*[:：]\s*(?P<target_price>[\d,]+)원?)'
+    r'|(?P<current>(?:포착\s*)?현재가\s*[:：]\s*(?P<current_price>[\d,]+)원?)'
+)
+
 
 def parse_stock_signal(message_text: str) -> dict:
     """
     테스트용 파싱 함수 (auto_trading.py와 동일한 로직)
     """
     try:
-        # 매수 신호인지 확인
-        if "Ai 종목포착 시그널" not in message_text and "종목포착" not in message_text:
+        # 매수 신호인지 확인 ("Ai 종목포착 시그널"도 "종목포착"을 포함)
+        if "종목포착" not in message_text:
+            return None
+
+        # 종목코드 괄호가 없으면 정규식 스캔 없이 바로 실패 처리
+        if "(" not in message_text:
+            print("⚠️ 종목명/종목코드를 찾을 수 없습니다")
             return None
 
+        # 어떤 패턴에도 쓰이지 않는 구분선 문자(￣)는 스캔 전에 제거
+        scan_text = message_text.replace("￣", "")
+
+        # 한 번의 스캔으로 항목별 첫 매칭만 수집
+        matches = {}
+        for match in _SIGNAL_RE.finditer(scan_text):
+            matches.setdefault(match.lastgroup, match)
+            if len(matches) == 3:
+                break
+
         # 종목명과 종목코드 추출
-        # 종목명이 비어있어도 종목코드만 있으면 매수 가능하도록 *? 사용 (0개 이상)
-        stock_pattern = r'(?:포착\s*)?종목명\s*[:：]\s*([가-힣a-zA-Z0-9＆&\s]*?)\s*\((\d{6})\)'
-        stock_match = re.search(stock_pattern, message_text)
+        stock_match = matches.get("stock")
 
         if not stock_match:
             print("⚠️ 종목명/종목코드를 찾을 수 없습니다")
             return None
 
-        stock_name = stock_match.group(1).strip()
-        stock_code = stock_match.group(2).strip()
+        stock_name = stock_match.group("name").strip()
+        stock_code = stock_match.group("code").strip()
 
         # 종목명이 비어있으면 종목코드를 종목명으로 사용
         if not stock_name:
@@ -34,17 +58,15 @@ def parse_stock_signal(message_text: str) -> dict:
 
         # 적정 매수가 추출 (선택)
         target_price = None
-        target_pattern = r'적정\s*매수가?\s*[:：]\s*([\d,]+)원?'
-        target_match = re.search(target_pattern, message_text)
+        target_match = matches.get("target")
         if target_match:
-            target_price = int(target_match.group(1).replace(',', ''))
+            target_price = int(target_match.group("target_price").replace(',', ''))
 
         # 현재가 추출 (선택)
         current_price = None
-        current_pattern = r'(?:포착\s*)?현재가\s*[:：]\s*([\d,]+)원?'
-        current_match = re.search(current_pattern, message_text)
+        current_match = matches.get("current")
         if current_match:
-            current_price = int(current_match.group(1).replace(',', ''))
+            current_price = int(current_match.group("current_price").replace(',', ''))
 
         result = {
             "stock_name": stock_name,
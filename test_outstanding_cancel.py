@@ -24,8 +24,13 @@ class MockKiwoomAPI:
 
     def __init__(self):
         self.orders = []
-        self.outstanding_orders = []
+        self.outstanding_orders = {}  # 주문번호(ord_no) → 미체결 주문
         self.cancelled_orders = []
+        self.access_token = "mock_token"
+
+    def set_outstanding_orders(self, orders):
+        """미체결 주문 목록 설정 (주문번호로 색인)"""
+        self.outstanding_orders = {order["ord_no"]: order for order in orders}
 
     def get_outstanding_orders(self, query_date=None):
         """미체결 주문 조회 (Mock)"""
@@ -34,7 +39,7 @@ class MockKiwoomAPI:
 
         return {
             "success": True,
-            "outstanding_orders": self.outstanding_orders
+            "outstanding_orders": list(self.outstanding_orders.values())
         }
 
     def cancel_order(self, order_no, stock_code, quantity):
@@ -51,10 +56,7 @@ class MockKiwoomAPI:
         })
 
         # 미체결 주문에서 제거
-        self.outstanding_orders = [
-            order for order in self.outstanding_orders
-            if order.get("ord_no") != order_no
-        ]
+        self.outstanding_orders.pop(order_no, None)
 
         return {
             "success": True,
@@ -66,8 +68,8 @@ class MockKiwoomAPI:
         }
 
     def get_access_token(self):
-        """Access Token 발급 (Mock)"""
-        return "mock_token"
+        """Access Token 발급 (Mock) - 실제 API처럼 보관 중인 토큰 재사용"""
+        return self.access_token
 
 
 async def test_cancel_outstanding_buy_orders_with_partial():
@@ -101,7 +103,7 @@ async def test_cancel_outstanding_buy_orders_with_partial():
     trading_system = TestTradingSystem()
 
     # 미체결 주문 설정 (40주 미체결)
-    mock_api.outstanding_orders = [
+    mock_api.set_outstanding_orders([
         {
             "ord_no": "BUY-123456",
             "stk_cd": "051980",
@@ -109,7 +111,7 @@ async def test_cancel_outstanding_buy_orders_with_partial():
             "ord_qty": "100",
             "rmndr_qty": "40"  # 미체결 수량
         }
-    ]
+    ])
 
     logger.info(f"\n💰 초기 상태:")
     logger.info(f"   체결 수량: 60주")
@@ -249,7 +251,7 @@ async def test_cancel_outstanding_buy_orders_already_cancelled():
     trading_system = TestTradingSystem()
 
     # 미체결 주문 없음 (이미 취소됨)
-    mock_api.outstanding_orders = []
+    mock_api.set_outstanding_orders([])
 
     logger.info(f"\n💰 초기 상태:")
     logger.info(f"   주문번호: BUY-999999 (이미 취소됨)")
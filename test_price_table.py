@@ -3,8 +3,9 @@
 """
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 from rich import box
-from datetime import datetime
+import time
 
 console = Console()
 
@@ -17,68 +18,103 @@ buy_info = {
     'target_profit_rate': 0.01
 }
 
-current_price = 10100
 buy_price = 10000
-profit_rate = (current_price - buy_price) / buy_price
-
-# 실시간 시세 정보 테이블 생성
-table = Table(title=f"📊 실시간 시세 정보 (WebSocket)", box=box.ROUNDED, show_header=False)
-table.add_column("항목", style="cyan", width=15)
-table.add_column("값", style="white")
-
-# 수익률에 따른 색상 결정
-profit_color = "red" if profit_rate >= 0 else "blue"
-profit_sign = "+" if profit_rate >= 0 else ""
-
-table.add_row("종목명", buy_info['stock_name'])
-table.add_row("종목코드", buy_info['stock_code'])
-table.add_row("평균 매수가", f"{buy_price:,}원")
-table.add_row("현재가", f"{current_price:,}원")
-table.add_row(
-    "수익률",
-    f"[{profit_color}]{profit_sign}{profit_rate*100:.2f}%[/{profit_color}] (목표: +{buy_info['target_profit_rate']*100:.2f}%)"
-)
-table.add_row(
-    "수익금",
-    f"[{profit_color}]{profit_sign}{(current_price - buy_price) * buy_info['quantity']:,}원[/{profit_color}]"
-)
-table.add_row("보유수량", f"{buy_info['quantity']:,}주")
-table.add_row("총 투자금액", f"{buy_price * buy_info['quantity']:,}원")
-table.add_row("업데이트", datetime.now().strftime("%H:%M:%S"))
+
+# 업데이트 시각 캐시 (초 단위) - 같은 초 안의 틱은 포맷을 재사용
+_last_ts_sec = -1
+_last_ts_str = ""
+
+
+class LiveCell:
+    """
+    값만 바꿔 끼울 수 있는 테이블 셀
+
+    Rich가 렌더링할 때마다 __rich__()로 현재 text(마크업 문자열)를 가져가므로,
+    테이블을 다시 만들지 않고 text만 바꾸면 다음 출력에 반영됩니다.
+    (열 너비 계산에도 쓰이도록 str이 아닌 Text로 변환해 반환)
+    """
+
+    def __init__(self, text: str = ""):
+        self.text = text
+
+    def __rich__(self) -> Text:
+        return Text.from_markup(self.text)
+
+
+def create_price_table(buy_info: dict, buy_price: int) -> tuple:
+    """
+    실시간 시세 테이블을 한 번만 생성
+
+    Returns:
+        (Table, 시세마다 바뀌는 셀 딕셔너리: current/profit_rate/profit/updated)
+    """
+    table = Table(title=f"📊 실시간 시세 정보 (WebSocket)", box=box.ROUNDED, show_header=False)
+    table.add_column("항목", style="cyan", width=15)
+    table.add_column("값", style="white")
+
+    cells = {
+        "current": LiveCell(),
+        "profit_rate": LiveCell(),
+        "profit": LiveCell(),
+        "updated": LiveCell(),
+    }
+
+    table.add_row("종목명", buy_info['stock_name'])
+    table.add_row("종목코드", buy_info['stock_code'])
+    table.add_row("평균 매수가", f"{buy_price:,}원")
+    table.add_row("현재가", cells["current"])
+    table.add_row("수익률", cells["profit_rate"])
+    table.add_row("수익금", cells["profit"])
+    table.add_row("보유수량", f"{buy_info['quantity']:,}주")
+    table.add_row("총 투자금액", f"{buy_price * buy_info['quantity']:,}원")
+    table.add_row("업데이트", cells["updated"])
+
+    return table, cells
+
+
+def update_time_str() -> str:
+    """현재 시각 HH:MM:SS (초가 바뀔 때만 다시 포맷)"""
+    global _last_ts_sec, _last_ts_str
+    s = int(time.time())
+    if s != _last_ts_sec:
+        _last_ts_sec = s
+        _last_ts_str = time.strftime("%H:%M:%S", time.localtime(s))
+    return _last_ts_str
+
+
+def update_price_table(cells: dict, current_price: int) -> None:
+    """현재가 기준으로 바뀌는 셀(현재가/수익률/수익금/업데이트)만 갱신"""
+    profit_rate = (current_price - buy_price) / buy_price
+
+    # 수익률에 따른 색상 결정
+    profit_color = "red" if profit_rate >= 0 else "blue"
+    profit_sign = "+" if profit_rate >= 0 else ""
+
+    cells["current"].text = f"{current_price:,}원"
+    cells["profit_rate"].text = (
+        f"[{profit_color}]{profit_sign}{profit_rate*100:.2f}%[/{profit_color}] (목표: +{buy_info['target_profit_rate']*100:.2f}%)"
+    )
+    cells["profit"].text = (
+        f"[{profit_color}]{profit_sign}{(current_price - buy_price) * buy_info['quantity']:,}원[/{profit_color}]"
+    )
+    cells["updated"].text = update_time_str()
+
+
+# 실시간 시세 정보 테이블 생성 (한 번만)
+table, cells = create_price_table(buy_info, buy_price)
+
+# 수익 케이스
+update_price_table(cells, 10100)
 
 print()
 console.print(table)
 print()
 
-# 손실 케이스도 테스트
+# 손실 케이스도 테스트 (같은 테이블에서 바뀌는 셀만 갱신)
 print("\n손실 케이스 테스트:")
 print("=" * 60)
 
-current_price_loss = 9750
-profit_rate_loss = (current_price_loss - buy_price) / buy_price
-
-table2 = Table(title=f"📊 실시간 시세 정보 (WebSocket)", box=box.ROUNDED, show_header=False)
-table2.add_column("항목", style="cyan", width=15)
-table2.add_column("값", style="white")
-
-profit_color_loss = "red" if profit_rate_loss >= 0 else "blue"
-profit_sign_loss = "+" if profit_rate_loss >= 0 else ""
-
-table2.add_row("종목명", buy_info['stock_name'])
-table2.add_row("종목코드", buy_info['stock_code'])
-table2.add_row("평균 매수가", f"{buy_price:,}원")
-table2.add_row("현재가", f"{current_price_loss:,}원")
-table2.add_row(
-    "수익률",
-    f"[{profit_color_loss}]{profit_sign_loss}{profit_rate_loss*100:.2f}%[/{profit_color_loss}] (목표: +{buy_info['target_profit_rate']*100:.2f}%)"
-)
-table2.add_row(
-    "수익금",
-    f"[{profit_color_loss}]{profit_sign_loss}{(current_price_loss - buy_price) * buy_info['quantity']:,}원[/{profit_color_loss}]"
-)
-table2.add_row("보유수량", f"{buy_info['quantity']:,}주")
-table2.add_row("총 투자금액", f"{buy_price * buy_info['quantity']:,}원")
-table2.add_row("업데이트", datetime.now().strftime("%H:%M:%S"))
-
-console.print(table2)
+update_price_table(cells, 9750)
+
+console.print(table)
 print()
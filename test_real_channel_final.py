@@ -4,7 +4,11 @@
 새로운 B안 로직이 실제 채널에서 어떻게 작동하는지 확인
 """
 import asyncio
+import io
 import os
+import re
+import sys
+from bisect import bisect_right
 from dotenv import load_dotenv
 from telethon import TelegramClient
 
@@ -20,6 +24,33 @@ API_HASH = os.getenv("API_HASH")
 SESSION_NAME = os.getenv("SESSION_NAME", "channel_copier")
 SOURCE_CHANNEL = os.getenv("SOURCE_CHANNEL")
 
+# 괄호 안 6자리 숫자 (종목코드) - parse_stock_signal과 같은 기준
+_STOCK_CODE_RE = re.compile(r'\((\d{6})\)')
+
+# 메시지를 이어 붙일 때 쓰는 구분자 (레코드 구분 문자)
+_SEPARATOR = "\x1e"
+
+
+def find_code_candidates(texts: list) -> set:
+    """
+    여러 메시지를 구분자로 이어 붙여 종목코드 패턴을 한 번에 검색
+
+    Args:
+        texts: 메시지 텍스트 리스트
+
+    Returns:
+        set: 종목코드 패턴이 있는 메시지의 인덱스 (texts 기준)
+    """
+    # 각 메시지가 이어 붙인 문자열에서 시작하는 위치
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text) + len(_SEPARATOR)
+
+    joined = _SEPARATOR.join(texts)
+    return {bisect_right(starts, match.start()) - 1 for match in _STOCK_CODE_RE.finditer(joined)}
+
 
 async def test_real_channel():
     """실제 채널 메시지로 최종 검증"""
@@ -47,19 +78,30 @@ async def test_real_channel():
         print("=" * 100)
 
         # 통계
-        detected_count = 0
         detected_messages = []
 
-        # 각 메시지 분석
-        for i, msg in enumerate(messages, 1):
-            if not msg.text:
-                continue
+        # 텍스트가 있는 메시지만 (원래 순번 유지)
+        text_messages = [(i, msg) for i, msg in enumerate(messages, 1) if msg.text]
+        text_count = len(text_messages)
+
+        # 종목코드 패턴이 있는 메시지만 골라 파싱 (전체를 한 번에 스캔)
+        candidates = find_code_candidates([msg.text for _, msg in text_messages])
+
+        def parse_candidates() -> list:
+            """후보 메시지를 새로운 로직으로 순서대로 파싱"""
+            return [
+                (i, msg, system.parse_stock_signal(msg.text))
+                for pos, (i, msg) in enumerate(text_messages)
+                if pos in candidates
+            ]
 
-            # 새로운 로직으로 파싱
-            result = system.parse_stock_signal(msg.text)
+        # 종목코드 검증 API(동기 HTTP 호출)가 이벤트 루프를 막지 않도록 별도 스레드에서 실행
+        # (API 호출 제한을 고려해 스레드 하나에서 순차 처리)
+        parsed = await asyncio.to_thread(parse_candidates)
 
+        # 각 메시지 분석
+        for i, msg, result in parsed:
             if result:
-                detected_count += 1
                 kst_time = system.to_kst(msg.date)
                 detected_messages.append({
                     "index": i,
@@ -68,35 +110,40 @@ async def test_real_channel():
                     "result": result
                 })
 
+        detected_count = len(detected_messages)
+
         # 통계 출력
         print("\n📊 분석 결과")
         print("=" * 100)
-        print(f"총 메시지: {len([m for m in messages if m.text])}개")
-        print(f"시그널 감지: {detected_count}개 ({detected_count/len([m for m in messages if m.text])*100:.1f}%)")
+        print(f"총 메시지: {text_count}개")
+        print(f"시그널 감지: {detected_count}개 ({detected_count/text_count*100:.1f}%)")
         print("=" * 100)
 
-        # 감지된 메시지 상세 출력
+        # 감지된 메시지 상세 출력 (메모리에 모았다가 한 번에 출력)
         if detected_messages:
-            print("\n📋 감지된 시그널 메시지 상세")
-            print("=" * 100)
+            out = io.StringIO()
+            print("\n📋 감지된 시그널 메시지 상세", file=out)
+            print("=" * 100, file=out)
 
             for msg_info in detected_messages:
-                print(f"\n[{msg_info['index']}] {msg_info['date']}")
-                print("-" * 100)
-                print(f"📨 메시지:")
+                print(f"\n[{msg_info['index']}] {msg_info['date']}", file=out)
+                print("-" * 100, file=out)
+                print(f"📨 메시지:", file=out)
                 lines = msg_info['text'].split('\n')
                 for line in lines[:7]:
-                    print(f"   {line}")
+                    print(f"   {line}", file=out)
                 if len(lines) > 7:
-                    print(f"   ... (총 {len(lines)}줄)")
+                    print(f"   ... (총 {len(lines)}줄)", file=out)
 
                 result = msg_info['result']
-                print(f"\n✅ 파싱 결과:")
-                print(f"   종목명: {result['stock_name']}")
-                print(f"   종목코드: {result['stock_code']}")
-                print(f"   적정매수가: {result['target_price']}")
-                print(f"   현재가: {result['current_price']}")
-                print("-" * 100)
+                print(f"\n✅ 파싱 결과:", file=out)
+                print(f"   종목명: {result['stock_name']}", file=out)
+                print(f"   종목코드: {result['stock_code']}", file=out)
+                print(f"   적정매수가: {result['target_price']}", file=out)
+                print(f"   현재가: {result['current_price']}", file=out)
+                print("-" * 100, file=out)
+
+            sys.stdout.write(out.getvalue())
 
         # 최종 평가
         print("\n" + "=" * 100)
@@ -105,7 +152,7 @@ async def test_real_channel():
 
         if detected_count > 0:
             print(f"✅ 새로운 B안 로직이 {detected_count}개의 시그널을 성공적으로 감지했습니다")
-            print(f"   - 감지율: {detected_count}/{len([m for m in messages if m.text])} ({detected_count/len([m for m in messages if m.text])*100:.1f}%)")
+            print(f"   - 감지율: {detected_count}/{text_count} ({detected_count/text_count*100:.1f}%)")
             print("\n주요 특징:")
             print("   ✅ 괄호 안 6자리 숫자만으로 시그널 인식")
             print("   ✅ 키워드에 의존하지 않는 유연한 파싱")
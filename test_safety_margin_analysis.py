@@ -2,10 +2,24 @@
 안전 마진 필요 여부 분석
 - 시장가 매수 vs 지정가 매수에서 안전 마진의 역할 검증
 """
+import io
 import sys
+from contextlib import redirect_stdout
 sys.path.append('/home/ralph/work/python/stock_tel')
 
-from kiwoom_order import get_tick_size
+from kiwoom_order import get_tick_size, get_tick_sizes
+
+
+def format_percent(numerator: int, denominator: int, digits: int = 1) -> str:
+    """
+    정수 비율을 백분율 문자열로 변환 (고정 소수점 정수 연산, 0 이상 값 전용)
+
+    소수점 아래 digits 자리까지 반올림(0.5 올림)하며, 부동소수점을 거치지 않아
+    플랫폼과 무관하게 같은 결과를 냅니다.
+    """
+    scale = 10 ** digits
+    scaled = (numerator * 100 * scale * 2 // denominator + 1) // 2
+    return f"{scaled // scale}.{scaled % scale:0{digits}d}"
 
 
 def test_market_buy():
@@ -49,15 +63,18 @@ def test_market_buy():
         (0.03, "3% 상승"),
     ]
 
-    for slippage_rate, description in slippage_cases:
-        actual_price = int(current_price * (1 + slippage_rate))
+    # 슬리피지별 체결가/필요 금액을 출력 루프 전에 한 번에 계산
+    actual_prices = [int(current_price * (1 + slippage_rate)) for slippage_rate, _ in slippage_cases]
 
-        # 안전 마진 O인 경우
-        required_with_margin = quantity_with_margin * actual_price
-        ok_with_margin = required_with_margin <= max_investment
+    # 안전 마진 O인 경우
+    required_with_margin_list = [quantity_with_margin * actual_price for actual_price in actual_prices]
+
+    # 안전 마진 X인 경우
+    required_without_margin_list = [quantity_without_margin * actual_price for actual_price in actual_prices]
 
-        # 안전 마진 X인 경우
-        required_without_margin = quantity_without_margin * actual_price
+    for (_, description), actual_price, required_with_margin, required_without_margin in zip(
+            slippage_cases, actual_prices, required_with_margin_list, required_without_margin_list):
+        ok_with_margin = required_with_margin <= max_investment
         ok_without_margin = required_without_margin <= max_investment
 
         print(f"\n   {description}: 체결가 {actual_price:,}원")
@@ -84,11 +101,16 @@ def test_limit_buy():
     tick_size = get_tick_size(current_price)
     order_price = current_price + tick_size
 
+    # 여러 번 출력되는 고정 금액은 천 단위 포맷을 한 번만 계산
+    max_investment_str = f"{max_investment:,}"
+    current_price_str = f"{current_price:,}"
+    order_price_str = f"{order_price:,}"
+
     print(f"\n💰 설정:")
-    print(f"   최대 투자금액: {max_investment:,}원")
-    print(f"   현재가: {current_price:,}원")
+    print(f"   최대 투자금액: {max_investment_str}원")
+    print(f"   현재가: {current_price_str}원")
     print(f"   틱 크기: {tick_size}원")
-    print(f"   지정가: {order_price:,}원")
+    print(f"   지정가: {order_price_str}원")
 
     # 현재 로직: 현재가 기준 + 안전 마진
     adjusted_investment = int(max_investment * (1 - safety_margin))
@@ -97,8 +119,8 @@ def test_limit_buy():
 
     print(f"\n❌ 현재 로직 (현재가 기준 + 안전 마진):")
     print(f"   조정 투자금액: {adjusted_investment:,}원")
-    print(f"   수량 계산: {adjusted_investment:,} ÷ {current_price:,} = {quantity_current_logic}주")
-    print(f"   실제 필요 금액: {quantity_current_logic}주 × {order_price:,}원 = {required_current_logic:,}원")
+    print(f"   수량 계산: {adjusted_investment:,} ÷ {current_price_str} = {quantity_current_logic}주")
+    print(f"   실제 필요 금액: {quantity_current_logic}주 × {order_price_str}원 = {required_current_logic:,}원")
     print(f"   남는 금액: {max_investment - required_current_logic:,}원")
     print(f"   투자 효율: {(required_current_logic / max_investment) * 100:.2f}%")
 
@@ -107,8 +129,8 @@ def test_limit_buy():
     required_improved = quantity_improved * order_price
 
     print(f"\n✅ 개선 로직 (지정가 기준, 안전 마진 없음):")
-    print(f"   수량 계산: {max_investment:,} ÷ {order_price:,} = {quantity_improved}주")
-    print(f"   실제 필요 금액: {quantity_improved}주 × {order_price:,}원 = {required_improved:,}원")
+    print(f"   수량 계산: {max_investment_str} ÷ {order_price_str} = {quantity_improved}주")
+    print(f"   실제 필요 금액: {quantity_improved}주 × {order_price_str}원 = {required_improved:,}원")
     print(f"   남는 금액: {max_investment - required_improved:,}원")
     print(f"   투자 효율: {(required_improved / max_investment) * 100:.2f}%")
 
@@ -120,10 +142,10 @@ def test_limit_buy():
 
     # 지정가의 안정성 검증
     print(f"\n🔒 지정가의 안정성:")
-    print(f"   - 지정가: {order_price:,}원 (고정)")
+    print(f"   - 지정가: {order_price_str}원 (고정)")
     print(f"   - 이 가격 이상으로는 절대 체결되지 않음 (보장)")
-    print(f"   - 최악의 경우: {quantity_improved}주 × {order_price:,}원 = {required_improved:,}원")
-    print(f"   - 최대 투자금액: {max_investment:,}원")
+    print(f"   - 최악의 경우: {quantity_improved}주 × {order_price_str}원 = {required_improved:,}원")
+    print(f"   - 최대 투자금액: {max_investment_str}원")
     print(f"   - 초과 여부: {'❌ 초과' if required_improved > max_investment else '✅ 안전'}")
 
     print(f"\n📌 결론:")
@@ -146,26 +168,31 @@ def test_extreme_cases():
         (500000, 10000, "소액: 50만원, 1만원 주식"),
     ]
 
-    for max_investment, current_price, description in test_cases:
-        tick_size = get_tick_size(current_price)
-        order_price = current_price + tick_size
-        safety_margin = 0.02
+    safety_margin = 0.02
+
+    # 틱 크기는 전체 케이스를 한 번에 조회하고, 수량은 출력 루프 전에 미리 계산
+    tick_sizes = get_tick_sizes([current_price for _, current_price, _ in test_cases])
+    order_prices = [current_price + tick_size
+                    for (_, current_price, _), tick_size in zip(test_cases, tick_sizes)]
 
-        # 현재 로직
-        adjusted_investment = int(max_investment * (1 - safety_margin))
-        quantity_current = adjusted_investment // current_price
+    # 현재 로직: 현재가 기준 + 안전 마진
+    quantities_current = [int(max_investment * (1 - safety_margin)) // current_price
+                          for max_investment, current_price, _ in test_cases]
 
-        # 개선 로직
-        quantity_improved = max_investment // order_price
+    # 개선 로직: 지정가 기준
+    quantities_improved = [max_investment // order_price
+                           for (max_investment, _, _), order_price in zip(test_cases, order_prices)]
 
+    for (max_investment, current_price, description), order_price, quantity_current, quantity_improved in zip(
+            test_cases, order_prices, quantities_current, quantities_improved):
         print(f"\n{description}:")
         print(f"   현재가: {current_price:,}원, 지정가: {order_price:,}원")
-        print(f"   현재 로직: {quantity_current}주 (효율: {(quantity_current * order_price / max_investment) * 100:.1f}%)")
-        print(f"   개선 로직: {quantity_improved}주 (효율: {(quantity_improved * order_price / max_investment) * 100:.1f}%)")
+        print(f"   현재 로직: {quantity_current}주 (효율: {format_percent(quantity_current * order_price, max_investment)}%)")
+        print(f"   개선 로직: {quantity_improved}주 (효율: {format_percent(quantity_improved * order_price, max_investment)}%)")
 
         diff = quantity_improved - quantity_current
         if diff > 0:
-            print(f"   ➡️ {diff}주 더 매수 가능 (+{(diff / quantity_current) * 100:.1f}%)")
+            print(f"   ➡️ {diff}주 더 매수 가능 (+{format_percent(diff, quantity_current)}%)")
 
 
 def main():
@@ -202,4 +229,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # 분석 단계별 print를 메모리에 모았다가 마지막에 한 번에 출력
+    out = io.StringIO()
+    try:
+        with redirect_stdout(out):
+            main()
+    finally:
+        sys.stdout.write(out.getvalue())
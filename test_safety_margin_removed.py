@@ -69,12 +69,15 @@ def main():
 
     print(f"\n📌 이전 로직 (안전 마진 2%)과 비교:")
 
+    # 안전 마진 2% 적용 투자금액 (시장가/지정가 공통, 1회만 계산)
+    old_adjusted_investment = int(max_investment * 0.98)
+
     # 이전 시장가: 98주
-    old_market_quantity = int(max_investment * 0.98) // current_price
+    old_market_quantity = old_adjusted_investment // current_price
     print(f"   시장가: {old_market_quantity}주 → {market_quantity}주 (+{market_quantity - old_market_quantity}주)")
 
-    # 이전 지정가: 97주 (현재가 기준 + 안전 마진)
-    old_limit_quantity = int(max_investment * 0.98) // current_price
+    # 이전 지정가: 98주 (현재가 기준 + 안전 마진)
+    old_limit_quantity = old_adjusted_investment // current_price
     print(f"   지정가: {old_limit_quantity}주 → {limit_quantity}주 (+{limit_quantity - old_limit_quantity}주)")
 
     print(f"\n🎯 최종 결론:")
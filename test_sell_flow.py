@@ -4,7 +4,7 @@
 import asyncio
 import sys
 import logging
-from datetime import datetime
+import time
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, '/home/ralph/work/python/stock_tel')
@@ -26,6 +26,10 @@ class MockKiwoomAPI:
     def __init__(self):
         self.orders = []
 
+    def _next_order_no(self) -> str:
+        """Mock 주문번호 생성 (SELL-단조 시계 ns, 포맷 없이 정수 그대로 사용)"""
+        return f"SELL-{time.monotonic_ns()}"
+
     def place_limit_sell_order(self, stock_code, quantity, price, account_no):
         """지정가 매도 주문 (익절)"""
         logger.info(f"   🔹 API 호출: place_limit_sell_order")
@@ -44,7 +48,7 @@ class MockKiwoomAPI:
 
         return {
             "success": True,
-            "order_no": f"SELL-{datetime.now().strftime('%H%M%S')}",
+            "order_no": self._next_order_no(),
             "message": "지정가 매도 주문 성공"
         }
 
@@ -64,7 +68,7 @@ class MockKiwoomAPI:
 
         return {
             "success": True,
-            "order_no": f"SELL-{datetime.now().strftime('%H%M%S')}",
+            "order_no": self._next_order_no(),
             "message": "시장가 매도 주문 성공"
         }
 
@@ -210,15 +214,13 @@ async def main():
     print("익절/손절 플로우 통합 테스트")
     print("🔬" * 40)
 
-    results = []
-
-    # 테스트 1: 익절
-    result1 = await test_profit_sell()
-    results.append(("익절 플로우", result1))
+    # 익절/손절 테스트는 각자 Mock API를 만들어 서로 독립적이므로 동시에 실행
+    result1, result2 = await asyncio.gather(test_profit_sell(), test_stop_loss())
 
-    # 테스트 2: 손절
-    result2 = await test_stop_loss()
-    results.append(("손절 플로우", result2))
+    results = [
+        ("익절 플로우", result1),
+        ("손절 플로우", result2),
+    ]
 
     # 최종 결과
     print("\n" + "=" * 80)
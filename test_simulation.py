@@ -7,11 +7,28 @@
 
 import asyncio
 import logging
+import sys
+import traceback
 from datetime import datetime
+from types import MappingProxyType
 from unittest.mock import Mock, AsyncMock, MagicMock
 from rich.console import Console
 from rich.table import Table
 
+from config import TradingConfig
+from exceptions import (
+    TradingNetworkError,
+    TradingTimeoutError,
+    TradingAuthError,
+    TradingInsufficientBalanceError,
+    TradingOrderRejectError,
+    get_exception_type,
+    format_exception_message
+)
+from kiwoom_websocket import KiwoomWebSocket
+from order_executor import OrderExecutor
+from price_monitor import PriceMonitor
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -19,7 +36,89 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-console = Console()
+# 터미널이 아닐 때(CI, 파이프)는 색상이 출력되지 않으므로 자동 하이라이팅(정규식 스캔)을 생략
+# 마크업은 태그 제거를 위해 그대로 해석
+console = Console() if sys.stdout.isatty() else Console(highlight=False)
+
+
+# 고정 주문 응답 (읽기 전용 - 매 호출 같은 객체를 돌려줘도 수정될 걱정 없음)
+_BUY_OK = MappingProxyType({
+    "success": True,
+    "order_no": "TEST-BUY-001",
+    "message": "매수 주문 성공"
+})
+_LIMIT_SELL_OK = MappingProxyType({
+    "success": True,
+    "order_no": "TEST-SELL-001",
+    "message": "매도 주문 성공"
+})
+_MARKET_SELL_OK = MappingProxyType({
+    "success": True,
+    "order_no": "TEST-SELL-002",
+    "message": "시장가 매도 성공"
+})
+
+
+class StubKiwoomAPI:
+    """
+    KiwoomOrderAPI 대역 (주문 기록 + 고정 응답)
+
+    Mock(spec=...) 대신 일반 클래스를 써서 호출마다 mock 내부 처리를 거치지 않습니다.
+    모듈에서 1개만 만들어 공유하고, 테스트마다 reset()으로 초기화합니다.
+    """
+
+    def __init__(self, current_price: int = 70000):
+        self.orders = []
+        self.current_price = current_price
+
+    def reset(self, current_price: int = 70000):
+        """주문 기록을 비우고 현재가를 다시 설정 (테스트 간 상태 격리)"""
+        self.orders.clear()
+        self.current_price = current_price
+        return self
+
+    def place_market_buy_order(self, stock_code, quantity, account_no):
+        """시장가 매수 주문"""
+        self.orders.append({
+            "type": "market_buy",
+            "stock_code": stock_code,
+            "quantity": quantity,
+            "account_no": account_no
+        })
+        return _BUY_OK
+
+    def place_limit_sell_order(self, stock_code, quantity, price, account_no):
+        """지정가 매도 주문 (익절)"""
+        self.orders.append({
+            "type": "limit_sell",
+            "stock_code": stock_code,
+            "quantity": quantity,
+            "price": price,
+            "account_no": account_no
+        })
+        return _LIMIT_SELL_OK
+
+    def place_market_sell_order(self, stock_code, quantity, account_no):
+        """시장가 매도 주문 (손절)"""
+        self.orders.append({
+            "type": "market_sell",
+            "stock_code": stock_code,
+            "quantity": quantity,
+            "account_no": account_no
+        })
+        return _MARKET_SELL_OK
+
+    def get_current_price(self, stock_code):
+        """현재가 조회"""
+        return {
+            "success": True,
+            "price": self.current_price,
+            "current_price": self.current_price
+        }
+
+
+# 테스트 간 공유하는 Stub API (테스트는 순차 실행되므로 reset()으로 충분)
+_STUB_API = StubKiwoomAPI()
 
 
 async def test_order_executor():
@@ -28,26 +127,8 @@ async def test_order_executor():
     console.print("[bold cyan]OrderExecutor 시뮬레이션 테스트")
     console.print("[bold cyan]=" * 40)
 
-    from order_executor import OrderExecutor
-    from kiwoom_order import KiwoomOrderAPI
-
-    # Mock API 생성
-    mock_api = Mock(spec=KiwoomOrderAPI)
-    mock_api.place_market_buy_order = Mock(return_value={
-        "success": True,
-        "order_no": "TEST-BUY-001",
-        "message": "매수 주문 성공"
-    })
-    mock_api.place_limit_sell_order = Mock(return_value={
-        "success": True,
-        "order_no": "TEST-SELL-001",
-        "message": "매도 주문 성공"
-    })
-    mock_api.place_market_sell_order = Mock(return_value={
-        "success": True,
-        "order_no": "TEST-SELL-002",
-        "message": "시장가 매도 성공"
-    })
+    # 공유 Stub API 초기화
+    mock_api = _STUB_API.reset()
 
     # OrderExecutor 생성
     executor = OrderExecutor(mock_api, "12345678-01")
@@ -118,10 +199,6 @@ async def test_price_monitor():
     console.print("[bold cyan]PriceMonitor 시뮬레이션 테스트")
     console.print("[bold cyan]=" * 40)
 
-    from price_monitor import PriceMonitor
-    from kiwoom_websocket import KiwoomWebSocket
-    from kiwoom_order import KiwoomOrderAPI
-
     # Mock WebSocket 생성
     mock_ws = Mock(spec=KiwoomWebSocket)
     mock_ws.connect = AsyncMock(return_value=None)
@@ -130,13 +207,8 @@ async def test_price_monitor():
     mock_ws.close = AsyncMock(return_value=None)
     mock_ws.get_current_price = Mock(return_value=70000)
 
-    # Mock API 생성
-    mock_api = Mock(spec=KiwoomOrderAPI)
-    mock_api.get_current_price = Mock(return_value={
-        "success": True,
-        "price": 70000,
-        "current_price": 70000
-    })
+    # 공유 Stub API 초기화
+    mock_api = _STUB_API.reset(current_price=70000)
 
     # PriceMonitor 생성
     monitor = PriceMonitor(mock_ws, mock_api)
@@ -191,16 +263,6 @@ async def test_exceptions():
     console.print("[bold cyan]커스텀 예외 시뮬레이션 테스트")
     console.print("[bold cyan]=" * 40)
 
-    from exceptions import (
-        TradingNetworkError,
-        TradingTimeoutError,
-        TradingAuthError,
-        TradingInsufficientBalanceError,
-        TradingOrderRejectError,
-        get_exception_type,
-        format_exception_message
-    )
-
     # 테스트 1: 예외 생성 및 메시지
     console.print("\n[bold yellow]📊 테스트 1: 예외 생성")
     test_exceptions = [
@@ -240,9 +302,6 @@ async def test_config():
     console.print("[bold cyan]TradingConfig 시뮬레이션 테스트")
     console.print("[bold cyan]=" * 40)
 
-    from config import TradingConfig
-    import os
-
     # 테스트 1: 환경변수 로드
     console.print("\n[bold yellow]📊 테스트 1: 환경변수 로드")
     try:
@@ -304,11 +363,8 @@ async def test_integration():
     console.print(f"  투자금액: {buy_price * quantity:,}원")
     console.print(f"  목표 수익률: {target_profit_rate*100:.1f}%")
 
-    # OrderExecutor 사용
-    from order_executor import OrderExecutor
-    from kiwoom_order import KiwoomOrderAPI
-
-    mock_api = Mock(spec=KiwoomOrderAPI)
+    # OrderExecutor 사용 (공유 Stub API 초기화)
+    mock_api = _STUB_API.reset()
     executor = OrderExecutor(mock_api, "12345678-01")
 
     # 매도가 계산
@@ -336,8 +392,10 @@ async def test_integration():
         (70700, "목표 도달"),
     ]
 
-    for price, status in price_scenarios:
-        current_rate = (price - buy_price) / buy_price
+    # 수익률은 출력 루프 전에 한 번에 계산
+    current_rates = [(price - buy_price) / buy_price for price, _ in price_scenarios]
+
+    for (price, status), current_rate in zip(price_scenarios, current_rates):
         console.print(f"  현재가: {price:,}원 ({status}) - 수익률: {current_rate*100:+.2f}%")
 
     console.print("\n[bold green]✅ 통합 시뮬레이션 완료!")
@@ -369,7 +427,6 @@ async def main():
             results.append((test_name, result))
         except Exception as e:
             console.print(f"\n[bold red]❌ {test_name} 테스트 실패: {e}[/bold red]")
-            import traceback
             traceback.print_exc()
             results.append((test_name, False))
 
@@ -383,16 +440,11 @@ async def main():
     result_table.add_column("테스트", style="cyan")
     result_table.add_column("결과", style="bold")
 
-    passed = 0
-    failed = 0
-
     for test_name, result in results:
-        if result:
-            result_table.add_row(test_name, "[green]✅ PASS[/green]")
-            passed += 1
-        else:
-            result_table.add_row(test_name, "[red]❌ FAIL[/red]")
-            failed += 1
+        result_table.add_row(test_name, "[green]✅ PASS[/green]" if result else "[red]❌ FAIL[/red]")
+
+    passed = sum(1 for _, result in results if result)
+    failed = len(results) - passed
 
     console.print(result_table)
 
@@ -410,5 +462,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(asyncio.run(main()))
@@ -10,6 +10,7 @@
 import asyncio
 import logging
 from datetime import datetime
+from functools import lru_cache
 from unittest.mock import Mock, AsyncMock
 from config import TradingConfig
 from trading_system_base import TradingSystemBase
@@ -22,6 +23,16 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_config() -> TradingConfig:
+    """
+    테스트 전체에서 공유하는 TradingConfig (환경변수는 한 번만 로드)
+
+    로드에 실패하면 캐싱되지 않으므로 각 테스트가 실패를 그대로 보고합니다.
+    """
+    return TradingConfig.from_env()
+
+
 class MockTradingSystem(TradingSystemBase):
     """테스트용 TradingSystemBase Mock 클래스"""
 
@@ -38,7 +49,7 @@ async def test_system_initialization():
 
     try:
         # Config 로드
-        config = TradingConfig.from_env()
+        config = _get_config()
         config.validate()
         logger.info("✅ Config 로드 및 검증 완료")
 
@@ -79,7 +90,7 @@ async def test_buy_flow():
     logger.info("=" * 80)
 
     try:
-        config = TradingConfig.from_env()
+        config = _get_config()
         system = MockTradingSystem(config)
 
         # kiwoom_api Mock
@@ -135,7 +146,7 @@ async def test_sell_flow():
     logger.info("=" * 80)
 
     try:
-        config = TradingConfig.from_env()
+        config = _get_config()
         system = MockTradingSystem(config)
 
         # 매수 정보 설정
@@ -216,7 +227,7 @@ async def test_stop_loss_flow():
     logger.info("=" * 80)
 
     try:
-        config = TradingConfig.from_env()
+        config = _get_config()
         system = MockTradingSystem(config)
 
         # 매수 정보 설정
@@ -293,7 +304,7 @@ async def test_force_sell_flow():
     logger.info("=" * 80)
 
     try:
-        config = TradingConfig.from_env()
+        config = _get_config()
         system = MockTradingSystem(config)
 
         # 매수 정보 설정
@@ -7,8 +7,9 @@
 import asyncio
 import json
 import logging
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
@@ -16,7 +17,7 @@ from rich.table import Table
 from rich import box
 
 from config import TradingConfig
-from kiwoom_order import KiwoomOrderAPI, calculate_sell_price
+from kiwoom_order import KiwoomOrderAPI, calculate_sell_price, get_tick_size
 from kiwoom_websocket import KiwoomWebSocket
 from order_executor import OrderExecutor
 from price_monitor import PriceMonitor
@@ -75,6 +76,10 @@ class TradingSystemBase(ABC):
         # Rich Console 초기화
         self.console = Console()
         self.live_display = None  # Live 디스플레이 객체
+        self._price_table_fixed = None  # (매수 정보 키, 고정 셀 문자열) - create_price_table 캐시
+        self._last_ts_sec = -1  # 업데이트 시각 캐시 (초 단위)
+        self._last_ts_str = ""
+        self._stop_loss_allowed_at = None  # (매수 시간, 지연 분, 손절 허용 시각) - 손절 지연 체크 캐시
 
         # 주기적 계좌 조회 설정
         self._last_balance_check = None  # 마지막 계좌 조회 시간
@@ -155,8 +160,6 @@ class TradingSystemBase(ABC):
                 # ========================================
                 # 지정가 매수 (현재가 + 1틱)
                 # ========================================
-                from kiwoom_order import get_tick_size
-
                 tick_size = get_tick_size(current_price)
                 order_price = current_price + tick_size
 
@@ -820,10 +823,11 @@ class TradingSystemBase(ABC):
             # 매수 후 경과 시간 체크 (손절 지연 설정)
             buy_time = self.buy_info.get("buy_time")
             if buy_time and self.config.stop_loss_delay_minutes > 0:
-                elapsed_minutes = (datetime.now() - buy_time).total_seconds() / 60
-                if elapsed_minutes < self.config.stop_loss_delay_minutes:
+                now = datetime.now()
+                if now < self._stop_loss_allowed_time(buy_time):
                     # 손절 지연 시간 이내면 손절하지 않음
                     if self.config.debug_mode:
+                        elapsed_minutes = (now - buy_time).total_seconds() / 60
                         logger.debug(f"⏱️  손절 지연: 매수 후 {elapsed_minutes:.1f}분 경과 (설정: {self.config.stop_loss_delay_minutes}분 이후부터 손절)")
                     return
 
@@ -951,7 +955,6 @@ class TradingSystemBase(ABC):
             return
 
         # 매도가 계산 (현재가에서 한 틱 아래)
-        from kiwoom_order import calculate_sell_price
         sell_price = calculate_sell_price(current_price)
 
         logger.info(f"💰 매도 주문가: {sell_price:,}원 (현재가에서 한 틱 아래)")
@@ -1436,6 +1439,51 @@ class TradingSystemBase(ABC):
             logger.error(f"❌ 강제 청산 시간 형식 오류: {e}")
             return False
 
+    def _fixed_price_cells(self, buy_price: int) -> dict:
+        """
+        시세 테이블에서 포지션 동안 바뀌지 않는 셀 문자열
+
+        시세 틱마다 다시 포맷하지 않도록 캐싱하고, 체결 검증 등으로
+        매수가/수량이 바뀐 경우에만 새로 계산합니다.
+        """
+        quantity = self.buy_info['quantity']
+        key = (buy_price, quantity)
+
+        cached = self._price_table_fixed
+        if cached is None or cached[0] != key:
+            cached = self._price_table_fixed = (key, {
+                "buy_price": f"{buy_price:,}원",
+                "quantity": f"{quantity:,}주",
+                "investment": f"{buy_price * quantity:,}원",
+            })
+
+        return cached[1]
+
+    def _stop_loss_allowed_time(self, buy_time: datetime) -> datetime:
+        """
+        손절 지연이 끝나는 시각 (매수 시간 + 손절 지연 분)
+
+        매수 시간이나 지연 설정이 바뀔 때만 계산해 두고, 시세 틱마다 datetime.now()와 비교만 합니다.
+        """
+        delay_minutes = self.config.stop_loss_delay_minutes
+        cached = self._stop_loss_allowed_at
+        if cached is None or cached[0] != buy_time or cached[1] != delay_minutes:
+            allowed_at = buy_time + timedelta(minutes=delay_minutes)
+            cached = self._stop_loss_allowed_at = (buy_time, delay_minutes, allowed_at)
+        return cached[2]
+
+    def _update_time_str(self) -> str:
+        """
+        시세 테이블 '업데이트' 시각 (HH:MM:SS)
+
+        초가 바뀔 때만 다시 포맷하고, 같은 초 안의 틱에서는 캐시를 재사용합니다.
+        """
+        s = int(time.time())
+        if s != self._last_ts_sec:
+            self._last_ts_sec = s
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(s))
+        return self._last_ts_str
+
     def create_price_table(
         self,
         current_price: int,
@@ -1452,9 +1500,11 @@ class TradingSystemBase(ABC):
         profit_color = "red" if profit_rate >= 0 else "blue"
         profit_sign = "+" if profit_rate >= 0 else ""
 
+        fixed = self._fixed_price_cells(buy_price)
+
         table.add_row("종목명", self.buy_info['stock_name'])
         table.add_row("종목코드", self.buy_info['stock_code'])
-        table.add_row("평균 매수가", f"{buy_price:,}원")
+        table.add_row("평균 매수가", fixed["buy_price"])
         table.add_row("현재가", f"{current_price:,}원")
         table.add_row(
             "수익률",
@@ -1464,9 +1514,9 @@ class TradingSystemBase(ABC):
             "수익금",
             f"[{profit_color}]{profit_sign}{(current_price - buy_price) * self.buy_info['quantity']:,}원[/{profit_color}]"
         )
-        table.add_row("보유수량", f"{self.buy_info['quantity']:,}주")
-        table.add_row("총 투자금액", f"{buy_price * self.buy_info['quantity']:,}원")
-        table.add_row("업데이트", datetime.now().strftime("%H:%M:%S"))
+        table.add_row("보유수량", fixed["quantity"])
+        table.add_row("총 투자금액", fixed["investment"])
+        table.add_row("업데이트", self._update_time_str())
 
         return table
 
@@ -1486,6 +1536,9 @@ class TradingSystemBase(ABC):
                 except asyncio.CancelledError:
                     pass
 
+            # 종목코드 검증 캐시 저장 (파일 I/O는 이벤트 루프 밖에서)
+            await asyncio.to_thread(self.kiwoom_api.save_stock_code_cache)
+
             logger.info("✅ 리소스 정리 완료")
 
         except Exception as e: